@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Generated by tools/gen_languages.py from locales/*.json - do not edit.
+
+CATALOGS = {
+    'en': (
+        (
+            'app_title',
+            'yes',
+            'no',
+            'ok',
+            'cancel',
+            'close',
+            'error',
+            'success',
+            'warning',
+            'info',
+            'proxy_start',
+            'proxy_stop',
+            'proxy_active',
+            'add_account',
+            'refresh_limits',
+            'help',
+            'activate',
+            'deactivate',
+            'delete_account',
+            'create_account',
+            'add',
+            'copy_javascript',
+            'copied',
+            'copy_error',
+            'open_certificate',
+            'installation_complete',
+            'current',
+            'email',
+            'status',
+            'limit',
+            'button_active',
+            'button_inactive',
+            'button_banned',
+            'button_start',
+            'button_stop',
+            'status_active',
+            'status_banned',
+            'status_token_expired',
+            'status_proxy_active',
+            'status_error',
+            'status_na',
+            'status_not_updated',
+            'status_healthy',
+            'status_unhealthy',
+            'status_banned_key',
+            'add_account_title',
+            'add_account_instruction',
+            'add_account_placeholder',
+            'how_to_get_json',
+            'how_to_get_json_close',
+            'json_info_title',
+            'tab_manual',
+            'tab_auto',
+            'manual_method_title',
+            'auto_method_title',
+            'chrome_extension_title',
+            'chrome_extension_description',
+            'chrome_extension_step_1',
+            'chrome_extension_step_2',
+            'chrome_extension_step_3',
+            'chrome_extension_step_4',
+            'step_1',
+            'step_2',
+            'step_3',
+            'step_4',
+            'step_5',
+            'step_6',
+            'step_7',
+            'help_title',
+            'help_what_is',
+            'help_what_is_content',
+            'help_how_works',
+            'help_how_works_content',
+            'help_how_to_use',
+            'help_how_to_use_content',
+            'cert_title',
+            'cert_explanation',
+            'cert_steps',
+            'cert_step_1',
+            'cert_step_2',
+            'cert_step_3',
+            'cert_step_4',
+            'cert_step_5',
+            'cert_step_6',
+            'cert_step_7',
+            'cert_step_8',
+            'cert_step_9',
+            'cert_path',
+            'cert_creating',
+            'cert_created_success',
+            'cert_creation_failed',
+            'cert_installing',
+            'cert_installed_success',
+            'cert_install_failed',
+            'cert_install_error',
+            'cert_manual_title',
+            'cert_manual_explanation',
+            'cert_manual_path',
+            'cert_manual_steps',
+            'cert_open_folder',
+            'cert_manual_complete',
+            'account_added_success',
+            'accounts_added_success',
+            'no_accounts_to_update',
+            'updating_limits',
+            'processing_account',
+            'refreshing_token',
+            'accounts_updated',
+            'proxy_starting',
+            'proxy_configuring',
+            'proxy_started',
+            'proxy_stopped',
+            'proxy_starting_account',
+            'activating_account',
+            'token_refreshing',
+            'proxy_started_account_activated',
+            'windows_proxy_config_failed',
+            'mitmproxy_start_failed',
+            'proxy_start_error',
+            'proxy_stop_error',
+            'account_not_found',
+            'account_banned_cannot_activate',
+            'account_activation_error',
+            'token_refresh_in_progress',
+            'token_refresh_error',
+            'account_activated',
+            'account_activation_failed',
+            'proxy_unexpected_stop',
+            'account_deactivated',
+            'account_deleted',
+            'token_renewed',
+            'account_banned_detected',
+            'token_renewal_progress',
+            'invalid_json',
+            'email_not_found',
+            'certificate_not_found',
+            'file_open_error',
+            'proxy_start_failed',
+            'proxy_config_failed',
+            'token_refresh_failed',
+            'token_refresh_skipped',
+            'account_delete_failed',
+            'enable_proxy_first',
+            'limit_info_failed',
+            'token_renewal_failed',
+            'token_check_error',
+            'delete_account_confirm',
+            'default_status',
+            'default_status_debug',
+            'stylesheet_load_error',
+            'health_update_error',
+            'token_update_error',
+            'account_update_error',
+            'active_account_set_error',
+            'active_account_clear_error',
+            'account_delete_error',
+            'limit_info_update_error',
+        ),
+        (
+            'Warp Account Manager',
+            'Yes',
+            'No',
+            'OK',
+            'Cancel',
+            'Close',
+            'Error',
+            'Success',
+            'Warning',
+            'Info',
+            'Start Proxy',
+            'Stop Proxy',
+            'Proxy Active',
+            'Add Account',
+            'Refresh Limits',
+            'Help',
+            '🟢 Activate',
+            '🔴 Deactivate',
+            '🗑️ Delete Account',
+            '🌐 Create Account',
+            'Add',
+            '📋 Copy JavaScript Code',
+            '✅ Copied!',
+            '❌ Error!',
+            '📁 Open Certificate File',
+            '✅ Installation Complete',
+            'Current',
+            'Email',
+            'Status',
+            'Limit',
+            'ACTIVE',
+            'INACTIVE',
+            'BAN',
+            'Start',
+            'Stop',
+            'Active',
+            'BAN',
+            'Token Expired',
+            ' (Proxy Active)',
+            'Error',
+            'N/A',
+            'Not Updated',
+            'healthy',
+            'unhealthy',
+            'banned',
+            'Add Account',
+            'Paste account JSON data below:',
+            'Paste JSON data here...',
+            '❓ How to get JSON data?',
+            '❌ Close',
+            'How to Get JSON Data?',
+            'Manual',
+            'Automatic',
+            'Manual JSON Addition',
+            'Automatic Addition with Chrome Extension',
+            '🌐 Chrome Extension',
+            'You can automatically add your accounts using our Chrome extension. This method is faster and easier.',
+            '<b>Step 1:</b> Manually install the Chrome extension',
+            '<b>Step 2:</b> Go to Warp.dev and create a new account',
+            '<b>Step 3:</b> After creating account, click the extension button on the redirected page',
+            '<b>Step 4:</b> Extension will automatically add the account to this program',
+            '<b>Step 1:</b> Go to Warp website and login',
+            '<b>Step 2:</b> Open browser developer console (F12)',
+            '<b>Step 3:</b> Go to Console tab',
+            '<b>Step 4:</b> Paste the JavaScript code below into console',
+            '<b>Step 5:</b> Press Enter',
+            '<b>Step 6:</b> Click the button that appears on the page',
+            '<b>Step 7:</b> Paste the copied JSON here',
+            '📖 Warp Account Manager - User Guide',
+            '🎯 What Does This Software Do?',
+            'You can view remaining limits between accounts you create to use Warp.dev code editor for free and easily switch between them by clicking the start button. It prevents you from getting banned by using different IDs for each operation.',
+            '⚙️ How Does It Work?',
+            'It modifies requests made by Warp editor using proxy. It performs operations using the information of the account you selected and different user IDs.',
+            '📝 How to Use?',
+            '<b>Initial Setup:</b><br>\nSince it works with proxy, you are expected to install the specified certificate in the trusted root certificate area on your computer at first launch. After completing the instructions, open Warp editor and login to any account. You must login to an account through the editor first.<br><br>\n\n<b>Adding Accounts (2 Methods):</b><br>\n<b>1. Chrome Extension:</b> Install our extension to Chrome. After creating account on Warp.dev, extension button appears on redirected page, one-click adds account automatically.<br>\n<b>2. Manual Method:</b> On account creation page, open console with F12, paste JavaScript code and copy JSON to add to program.<br><br>\n\n<b>Chrome Extension Installation:</b><br>\nManually install the Chrome extension. When extension is installed, automatic account addition button appears on warp.dev/logged_in/remote pages. On normal logged_in pages, a page refresh button appears.<br><br>\n\n<b>Usage:</b><br>\nTo use the accounts you added to the software, you activate the Proxy. After the activation process, you can activate one of your accounts by clicking the start button and continue using the Warp editor. You can instantly see the limits between your accounts with the "Refresh Limits" button.',
+            '🔒 Proxy Certificate Installation Required',
+            'For Warp Proxy to work properly, mitmproxy certificate needs to be added to trusted root certificate authorities.\n\nThis process is done only once and does not affect your system security.',
+            '📋 Installation Steps:',
+            '<b>Step 1:</b> Click the "Open Certificate File" button below',
+            '<b>Step 2:</b> Double-click the opened file',
+            '<b>Step 3:</b> Click "Install Certificate..." button',
+            '<b>Step 4:</b> Select "Local Machine" and click "Next"',
+            '<b>Step 5:</b> Select "Place all certificates in the following store"',
+            '<b>Step 6:</b> Click "Browse" button',
+            '<b>Step 7:</b> Select "Trusted Root Certification Authorities" folder',
+            '<b>Step 8:</b> Click "OK" and "Next" buttons',
+            '<b>Step 9:</b> Click "Finish" button',
+            'Certificate file: {}',
+            '🔒 Creating certificate...',
+            '✅ Certificate file created successfully',
+            '❌ Certificate creation failed',
+            '🔒 Checking certificate installation...',
+            '✅ Certificate installed automatically',
+            '❌ Certificate installation failed - Administrator privileges may be required',
+            '❌ Certificate installation error: {}',
+            '🔒 Manual Certificate Installation Required',
+            'Automatic certificate installation failed.\n\nYou need to install the certificate manually. This process is done only once and does not affect your system security.',
+            'Certificate file location:',
+            '<b>Manual Installation Steps:</b><br><br>\n<b>1.</b> Go to the file path above<br>\n<b>2.</b> Double-click the <code>mitmproxy-ca-cert.cer</code> file<br>\n<b>3.</b> Click "Install Certificate..." button<br>\n<b>4.</b> Select "Local Machine" and click "Next"<br>\n<b>5.</b> Select "Place all certificates in the following store"<br>\n<b>6.</b> Click "Browse" → Select "Trusted Root Certification Authorities"<br>\n<b>7.</b> Click "OK" → "Next" → "Finish"',
+            '📁 Open Certificate Folder',
+            '✅ Installation Complete',
+            'Account added successfully',
+            '{} accounts added successfully',
+            'No accounts found to update',
+            'Updating limits...',
+            'Processing: {}',
+            'Refreshing token: {}',
+            '{} accounts updated',
+            'Starting proxy...',
+            'Configuring Windows proxy settings...',
+            'Proxy started: {}',
+            'Proxy stopped',
+            'Starting proxy and activating {}...',
+            'Activating account: {}...',
+            'Refreshing token: {}',
+            'Proxy started and {} activated',
+            'Windows proxy configuration failed',
+            'Mitmproxy failed to start - Check port 8080',
+            'Proxy start error: {}',
+            'Proxy stop error: {}',
+            'Account not found',
+            '{} account is banned - cannot activate',
+            'Account activation error: {}',
+            'Token refresh in progress, please wait...',
+            'Token refresh error: {}',
+            '{} account activated',
+            'Account activation failed',
+            '⚠️ Proxy stopped unexpectedly',
+            '{} account deactivated',
+            '{} account deleted',
+            '{} token renewed',
+            '⛔ {} account banned!',
+            '🔄 {}/{} tokens renewed',
+            'Invalid JSON format',
+            'Email not found',
+            'Certificate file not found!',
+            'File open error: {}',
+            'Proxy could not be started - Check port 8080',
+            'Windows proxy settings could not be configured',
+            '{} token could not be renewed',
+            '{} token refresh skipped (failed recently)',
+            'Account could not be deleted',
+            'Start proxy first to activate account',
+            'Could not get limit information',
+            '⚠️ {} token could not be renewed',
+            '❌ Token check error',
+            "Are you sure you want to delete '{}' account?\n\nThis action cannot be undone!",
+            'Enable Proxy and click the start button on accounts to start using.',
+            'Enable Proxy and click the start button on accounts to start using. (Debug Mode Active)',
+            'Could not load stylesheet: {}',
+            'Health status update error: {}',
+            'Token update error: {}',
+            'Account update error: {}',
+            'Active account set error: {}',
+            'Active account clear error: {}',
+            'Account delete error: {}',
+            'Limit info update error: {}',
+        ),
+    ),
+    'id': (
+        (
+            'app_title',
+            'yes',
+            'no',
+            'ok',
+            'cancel',
+            'close',
+            'error',
+            'success',
+            'warning',
+            'info',
+            'proxy_start',
+            'proxy_stop',
+            'proxy_active',
+            'add_account',
+            'refresh_limits',
+            'help',
+            'activate',
+            'deactivate',
+            'delete_account',
+            'create_account',
+            'add',
+            'copy_javascript',
+            'copied',
+            'copy_error',
+            'open_certificate',
+            'installation_complete',
+            'current',
+            'email',
+            'status',
+            'limit',
+            'button_active',
+            'button_inactive',
+            'button_banned',
+            'button_start',
+            'button_stop',
+            'status_active',
+            'status_banned',
+            'status_token_expired',
+            'status_proxy_active',
+            'status_error',
+            'status_na',
+            'status_not_updated',
+            'status_healthy',
+            'status_unhealthy',
+            'status_banned_key',
+            'add_account_title',
+            'add_account_instruction',
+            'add_account_placeholder',
+            'how_to_get_json',
+            'how_to_get_json_close',
+            'json_info_title',
+            'tab_manual',
+            'tab_auto',
+            'manual_method_title',
+            'auto_method_title',
+            'chrome_extension_title',
+            'chrome_extension_description',
+            'chrome_extension_step_1',
+            'chrome_extension_step_2',
+            'chrome_extension_step_3',
+            'chrome_extension_step_4',
+            'step_1',
+            'step_2',
+            'step_3',
+            'step_4',
+            'step_5',
+            'step_6',
+            'step_7',
+            'help_title',
+            'help_what_is',
+            'help_what_is_content',
+            'help_how_works',
+            'help_how_works_content',
+            'help_how_to_use',
+            'help_how_to_use_content',
+            'cert_title',
+            'cert_explanation',
+            'cert_steps',
+            'cert_step_1',
+            'cert_step_2',
+            'cert_step_3',
+            'cert_step_4',
+            'cert_step_5',
+            'cert_step_6',
+            'cert_step_7',
+            'cert_step_8',
+            'cert_step_9',
+            'cert_path',
+            'cert_creating',
+            'cert_created_success',
+            'cert_creation_failed',
+            'cert_installing',
+            'cert_installed_success',
+            'cert_install_failed',
+            'cert_install_error',
+            'cert_manual_title',
+            'cert_manual_explanation',
+            'cert_manual_path',
+            'cert_manual_steps',
+            'cert_open_folder',
+            'cert_manual_complete',
+            'account_added_success',
+            'accounts_added_success',
+            'no_accounts_to_update',
+            'updating_limits',
+            'processing_account',
+            'refreshing_token',
+            'accounts_updated',
+            'proxy_starting',
+            'proxy_configuring',
+            'proxy_started',
+            'proxy_stopped',
+            'proxy_starting_account',
+            'activating_account',
+            'token_refreshing',
+            'proxy_started_account_activated',
+            'windows_proxy_config_failed',
+            'mitmproxy_start_failed',
+            'proxy_start_error',
+            'proxy_stop_error',
+            'account_not_found',
+            'account_banned_cannot_activate',
+            'account_activation_error',
+            'token_refresh_in_progress',
+            'token_refresh_error',
+            'account_activated',
+            'account_activation_failed',
+            'proxy_unexpected_stop',
+            'account_deactivated',
+            'account_deleted',
+            'token_renewed',
+            'account_banned_detected',
+            'token_renewal_progress',
+            'invalid_json',
+            'email_not_found',
+            'certificate_not_found',
+            'file_open_error',
+            'proxy_start_failed',
+            'proxy_config_failed',
+            'token_refresh_failed',
+            'token_refresh_skipped',
+            'account_delete_failed',
+            'enable_proxy_first',
+            'limit_info_failed',
+            'token_renewal_failed',
+            'token_check_error',
+            'delete_account_confirm',
+            'default_status',
+            'default_status_debug',
+            'stylesheet_load_error',
+            'health_update_error',
+            'token_update_error',
+            'account_update_error',
+            'active_account_set_error',
+            'active_account_clear_error',
+            'account_delete_error',
+            'limit_info_update_error',
+        ),
+        (
+            'Pengelola Akun Warp',
+            'Ya',
+            'Tidak',
+            'OK',
+            'Batal',
+            'Tutup',
+            'Kesalahan',
+            'Berhasil',
+            'Peringatan',
+            'Info',
+            'Mulai Proxy',
+            'Hentikan Proxy',
+            'Proxy Aktif',
+            'Tambah Akun',
+            'Segarkan Batas',
+            'Bantuan',
+            '🟢 Aktifkan',
+            '🔴 Nonaktifkan',
+            '🗑️ Hapus Akun',
+            '🌐 Buat Akun',
+            'Tambahkan',
+            '📋 Salin Kode JavaScript',
+            '✅ Disalin!',
+            '❌ Kesalahan!',
+            '📁 Buka Berkas Sertifikat',
+            '✅ Instalasi Selesai',
+            'Saat Ini',
+            'Email',
+            'Status',
+            'Batas',
+            'AKTIF',
+            'NONAKTIF',
+            'BAN',
+            'Mulai',
+            'Berhenti',
+            'Aktif',
+            'BAN',
+            'Token Kedaluwarsa',
+            ' (Proxy Aktif)',
+            'Kesalahan',
+            'N/A',
+            'Belum Diperbarui',
+            'sehat',
+            'tidak sehat',
+            'banned',
+            'Tambah Akun',
+            'Tempel data JSON akun di bawah:',
+            'Tempel data JSON di sini...',
+            '❓ Cara mendapatkan data JSON?',
+            '❌ Tutup',
+            'Cara Mendapatkan Data JSON?',
+            'Manual',
+            'Otomatis',
+            'Penambahan JSON Manual',
+            'Penambahan Otomatis dengan Ekstensi Chrome',
+            '🌐 Ekstensi Chrome',
+            'Anda dapat menambahkan akun secara otomatis menggunakan ekstensi Chrome kami. Metode ini lebih cepat dan mudah.',
+            '<b>Langkah 1:</b> Pasang ekstensi Chrome secara manual',
+            '<b>Langkah 2:</b> Buka Warp.dev dan buat akun baru',
+            '<b>Langkah 3:</b> Setelah membuat akun, klik tombol ekstensi pada halaman yang dialihkan',
+            '<b>Langkah 4:</b> Ekstensi akan secara otomatis menambahkan akun ke program ini',
+            '<b>Langkah 1:</b> Buka situs Warp dan masuk',
+            '<b>Langkah 2:</b> Buka konsol pengembang browser (F12)',
+            '<b>Langkah 3:</b> Pergi ke tab Console',
+            '<b>Langkah 4:</b> Tempel kode JavaScript di bawah ini ke konsol',
+            '<b>Langkah 5:</b> Tekan Enter',
+            '<b>Langkah 6:</b> Klik tombol yang muncul di halaman',
+            '<b>Langkah 7:</b> Tempel JSON yang disalin di sini',
+            '📖 Pengelola Akun Warp - Panduan Pengguna',
+            '🎯 Apa Fungsi Perangkat Lunak Ini?',
+            'Anda dapat melihat sisa batas antar akun yang dibuat untuk menggunakan editor kode Warp.dev secara gratis dan dengan mudah beralih dengan menekan tombol mulai. Alat ini mencegah pemblokiran dengan menggunakan ID berbeda untuk setiap tindakan.',
+            '⚙️ Bagaimana Cara Kerjanya?',
+            'Aplikasi ini memodifikasi permintaan yang dibuat editor Warp menggunakan proxy. Operasi dijalankan menggunakan informasi akun yang Anda pilih dan ID pengguna yang berbeda.',
+            '📝 Cara Menggunakan?',
+            '<b>Penyiapan Awal:</b><br>\nKarena bekerja dengan proxy, pada peluncuran pertama Anda harus memasang sertifikat yang ditentukan ke dalam penyimpanan akar tepercaya di komputer Anda. Setelah menyelesaikan instruksi, buka editor Warp dan masuk ke akun apa pun. Anda harus masuk melalui editor terlebih dahulu.<br><br>\n\n<b>Menambahkan Akun (2 Metode):</b><br>\n<b>1. Ekstensi Chrome:</b> Pasang ekstensi kami ke Chrome. Setelah membuat akun di Warp.dev, tombol ekstensi muncul pada halaman yang dialihkan dan dalam satu klik akun ditambahkan otomatis.<br>\n<b>2. Metode Manual:</b> Di halaman pembuatan akun, buka konsol dengan F12, tempel kode JavaScript, dan tempel JSON ke program.<br><br>\n\n<b>Instalasi Ekstensi Chrome:</b><br>\nPasang ekstensi Chrome secara manual. Setelah terpasang, tombol penambahan akun otomatis muncul pada halaman warp.dev/logged_in/remote. Pada halaman logged_in biasa muncul tombol untuk memuat ulang halaman.<br><br>\n\n<b>Penggunaan:</b><br>\nUntuk menggunakan akun yang telah ditambahkan, aktifkan Proxy. Setelah aktif, Anda dapat mengaktifkan salah satu akun dengan tombol mulai dan terus memakai editor Warp. Tombol "Segarkan Batas" menampilkan batas akun secara langsung.',
+            '🔒 Instalasi Sertifikat Proxy Diperlukan',
+            'Agar Warp Proxy berfungsi dengan baik, sertifikat mitmproxy harus ditambahkan ke Otoritas Sertifikat Root Tepercaya.\n\nProses ini hanya dilakukan sekali dan tidak memengaruhi keamanan sistem Anda.',
+            '📋 Langkah Instalasi:',
+            '<b>Langkah 1:</b> Klik tombol "Buka Berkas Sertifikat" di bawah',
+            '<b>Langkah 2:</b> Klik ganda berkas yang terbuka',
+            '<b>Langkah 3:</b> Klik tombol "Install Certificate..."',
+            '<b>Langkah 4:</b> Pilih "Local Machine" dan klik "Next"',
+            '<b>Langkah 5:</b> Pilih "Place all certificates in the following store"',
+            '<b>Langkah 6:</b> Klik "Browse"',
+            '<b>Langkah 7:</b> Pilih folder "Trusted Root Certification Authorities"',
+            '<b>Langkah 8:</b> Klik tombol "OK" dan "Next"',
+            '<b>Langkah 9:</b> Klik tombol "Finish"',
+            'Berkas sertifikat: {}',
+            '🔒 Membuat sertifikat...',
+            '✅ Berkas sertifikat berhasil dibuat',
+            '❌ Gagal membuat sertifikat',
+            '🔒 Memeriksa instalasi sertifikat...',
+            '✅ Sertifikat berhasil dipasang otomatis',
+            '❌ Instalasi sertifikat gagal - Mungkin memerlukan hak administrator',
+            '❌ Kesalahan instalasi sertifikat: {}',
+            '🔒 Instalasi Sertifikat Manual Diperlukan',
+            'Instalasi sertifikat otomatis gagal.\n\nAnda perlu memasang sertifikat secara manual. Proses ini hanya dilakukan sekali dan tidak memengaruhi keamanan sistem Anda.',
+            'Lokasi berkas sertifikat:',
+            '<b>Langkah Instalasi Manual:</b><br><br>\n<b>1.</b> Pergi ke jalur berkas di atas<br>\n<b>2.</b> Klik ganda berkas <code>mitmproxy-ca-cert.cer</code><br>\n<b>3.</b> Klik tombol "Install Certificate..."<br>\n<b>4.</b> Pilih "Local Machine" lalu klik "Next"<br>\n<b>5.</b> Pilih "Place all certificates in the following store"<br>\n<b>6.</b> Klik "Browse" → pilih "Trusted Root Certification Authorities"<br>\n<b>7.</b> Klik "OK" → "Next" → "Finish"',
+            '📁 Buka Folder Sertifikat',
+            '✅ Instalasi Selesai',
+            'Akun berhasil ditambahkan',
+            '{} akun berhasil ditambahkan',
+            'Tidak ada akun untuk diperbarui',
+            'Memperbarui batas...',
+            'Memproses: {}',
+            'Menyegarkan token: {}',
+            '{} akun diperbarui',
+            'Memulai proxy...',
+            'Mengonfigurasi pengaturan proxy Windows...',
+            'Proxy dimulai: {}',
+            'Proxy dihentikan',
+            'Memulai proxy dan mengaktifkan {}...',
+            'Mengaktifkan akun: {}...',
+            'Menyegarkan token: {}',
+            'Proxy dimulai dan {} diaktifkan',
+            'Pengaturan proxy Windows gagal dikonfigurasi',
+            'Mitmproxy gagal dimulai - Periksa port 8080',
+            'Kesalahan memulai proxy: {}',
+            'Kesalahan menghentikan proxy: {}',
+            'Akun tidak ditemukan',
+            '{} akun diblokir - tidak dapat diaktifkan',
+            'Kesalahan aktivasi akun: {}',
+            'Penyegaran token sedang berlangsung, mohon tunggu...',
+            'Kesalahan penyegaran token: {}',
+            '{} akun diaktifkan',
+            'Akun gagal diaktifkan',
+            '⚠️ Proxy berhenti secara tak terduga',
+            '{} akun dinonaktifkan',
+            '{} akun dihapus',
+            '{} token diperbarui',
+            '⛔ {} akun diblokir!',
+            '🔄 {}/{} token diperbarui',
+            'Format JSON tidak valid',
+            'Email tidak ditemukan',
+            'Berkas sertifikat tidak ditemukan!',
+            'Kesalahan membuka berkas: {}',
+            'Proxy tidak dapat dimulai - Periksa port 8080',
+            'Pengaturan proxy Windows tidak dapat dikonfigurasi',
+            '{} token gagal diperbarui',
+            '{} pembaruan token dilewati (baru saja gagal)',
+            'Akun tidak dapat dihapus',
+            'Aktifkan proxy terlebih dahulu untuk mengaktifkan akun',
+            'Informasi batas gagal diambil',
+            '⚠️ {} token gagal diperbarui',
+            '❌ Kesalahan pemeriksaan token',
+            "Apakah Anda yakin ingin menghapus akun '{}'?\n\nTindakan ini tidak dapat dibatalkan!",
+            'Aktifkan Proxy dan klik tombol mulai pada akun untuk mulai menggunakan.',
+            'Aktifkan Proxy dan klik tombol mulai pada akun untuk mulai menggunakan. (Mode Debug Aktif)',
+            'Gagal memuat stylesheet: {}',
+            'Kesalahan pembaruan status kesehatan: {}',
+            'Kesalahan pembaruan token: {}',
+            'Kesalahan pembaruan akun: {}',
+            'Kesalahan menetapkan akun aktif: {}',
+            'Kesalahan menghapus akun aktif: {}',
+            'Kesalahan menghapus akun: {}',
+            'Kesalahan pembaruan informasi batas: {}',
+        ),
+    ),
+}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compile locales/*.json into languages_data.py and minify the catalogs.
+
+The generated module stores every catalog as a pair of string tuples
+(keys, values). Tuples of string constants are marshalled straight into
+the .pyc, so importing the catalogs is a single LOAD_CONST per language
+instead of parsing JSON or executing one bytecode op per entry.
+
+The JSON catalogs themselves are rewritten without structural
+whitespace, which keeps the fallback parse path and the files on disk
+as small as possible.
+
+Run after editing any file in locales/:
+
+    python tools/gen_languages.py
+"""
+
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from languages import expand_catalog_value  # noqa: E402
+
+LOCALES_DIR = os.path.join(ROOT_DIR, "locales")
+OUTPUT_PATH = os.path.join(ROOT_DIR, "languages_data.py")
+
+HEADER = '''#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Generated by tools/gen_languages.py from locales/*.json - do not edit.
+
+'''
+
+
+def load_catalogs():
+    """Read every locales/<code>.json catalog, keyed by language code"""
+    catalogs = {}
+    for name in sorted(os.listdir(LOCALES_DIR)):
+        if name.endswith(".json"):
+            with open(os.path.join(LOCALES_DIR, name), "rb") as f:
+                catalogs[name[:-len(".json")]] = json.loads(f.read())
+    return catalogs
+
+
+def write_minified(catalogs):
+    """Rewrite each locales/<code>.json without structural whitespace"""
+    for code, catalog in catalogs.items():
+        path = os.path.join(LOCALES_DIR, f"{code}.json")
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(catalog, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_tuple(items, indent):
+    """Render a tuple literal with one item per line"""
+    pad = " " * indent
+    lines = [f"{pad}    {item!r}," for item in items]
+    return "(\n" + "\n".join(lines) + f"\n{pad})"
+
+
+def render_module(catalogs):
+    """Render the languages_data.py source for the given catalogs"""
+    parts = [HEADER, "CATALOGS = {\n"]
+    for code, catalog in catalogs.items():
+        keys = render_tuple(catalog.keys(), 8)
+        values = render_tuple((expand_catalog_value(v) for v in catalog.values()), 8)
+        parts.append(f"    {code!r}: (\n        {keys},\n        {values},\n    ),\n")
+    parts.append("}\n")
+    return "".join(parts)
+
+
+def main():
+    catalogs = load_catalogs()
+    write_minified(catalogs)
+    with open(OUTPUT_PATH, "w", encoding="utf-8", newline="\n") as f:
+        f.write(render_module(catalogs))
+    print(f"Wrote {OUTPUT_PATH} ({', '.join(catalogs)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
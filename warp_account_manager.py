@@ -2,21 +2,43 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import atexit
+import bisect
+import functools
+import hashlib
 import json
 import sqlite3
 import requests
 import time
 import subprocess
 import os
+import re
 import psutil
+import shutil
+import socket
+import threading
 import urllib3
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from enum import IntEnum
 from pathlib import Path
-from languages import get_language_manager, _
+from urllib.parse import urlencode
+from languages import get_language_manager, _, _i, TextKey
 from warp_bridge_server import WarpBridgeServer
 IS_WINDOWS = sys.platform == "win32"
 IS_MACOS = sys.platform == "darwin"
 IS_LINUX = not IS_WINDOWS and not IS_MACOS
 
+# Per-user locations, resolved once at import
+HOME_DIR = Path.home()
+MITMPROXY_CONFDIR = HOME_DIR / ".mitmproxy"
+WARP_PROXY_DIR = HOME_DIR / ".warp_proxy"
+PAC_FILE = WARP_PROXY_DIR / "warp_proxy.pac"
+# PID of the mitmdump started by this app, so stop() needn't search for it
+MITMPROXY_PID_FILE = MITMPROXY_CONFDIR / "warp.pid"
+MACOS_LOGIN_KEYCHAIN = HOME_DIR / "Library" / "Keychains" / "login.keychain-db"
+
 # Platform-specific imports
 if IS_WINDOWS:
     import winreg
@@ -30,18 +52,215 @@ else:
     winreg = None
     BridgeConfig = None
 
+# Prefer orjson for account (de)serialization when it is installed; both
+# variants produce compact JSON so stored account blobs stay small
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+    # UTF-8 encoded variant for HTTP request bodies
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 # Suppress SSL warnings when using mitmproxy
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def _make_http_session(trust_env=True):
+    """Create a keep-alive session that pools TLS connections and retries failed connection attempts"""
+    session = requests.Session()
+    session.trust_env = trust_env
+    session.mount('https://', requests.adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Only retry when the request never reached the server: token refreshes
+        # and GraphQL calls are POSTs that must not be resent after a read timeout
+        max_retries=urllib3.util.Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2)
+    ))
+    return session
+
+
+# Sessions shared by every API call. The direct one ignores environment and
+# system proxy settings (which may point at our own mitmproxy), so requests
+# skip the per-call proxy lookup instead of overriding its result
+_HTTP_SESSION = _make_http_session()
+_DIRECT_HTTP_SESSION = _make_http_session(trust_env=False)
+
+# Close pooled keep-alive connections cleanly when the application exits
+atexit.register(_HTTP_SESSION.close)
+atexit.register(_DIRECT_HTTP_SESSION.close)
+
+# Only advertise encodings urllib3 can decode here ("br" needs brotli installed)
+ACCEPT_ENCODING = urllib3.util.make_headers(accept_encoding=True)['accept-encoding']
+
+
+@functools.lru_cache(maxsize=16)
+def _token_refresh_url(api_key):
+    """Firebase token endpoint for an API key, query-encoded once per key"""
+    return "https://securetoken.googleapis.com/v1/token?" + urlencode({'key': api_key})
+
+
+@functools.lru_cache(maxsize=256)
+def _token_refresh_body(refresh_token):
+    """Serialized refresh request for a refresh token; a rotated token gets a new entry"""
+    return _json_dumps_bytes({'grant_type': 'refresh_token', 'refresh_token': refresh_token})
+
+
+# Headers of the manager's own token refresh requests
+_TOKEN_REFRESH_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'WarpAccountManager/1.0'
+}
+
+
+# Tokens are refreshed once they have less than this long to live (ms)
+TOKEN_REFRESH_MARGIN_MS = 5 * 60 * 1000
+
+
+def token_needs_refresh(expiration_time, now_ms=None):
+    """Return True if a token expiring at expiration_time (ms epoch) should be refreshed now"""
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+    return now_ms >= expiration_time - TOKEN_REFRESH_MARGIN_MS
+
+
+# Token refreshes currently running, by email, so concurrent callers share one request
+_inflight_refreshes = {}
+_inflight_lock = threading.Lock()
+
+# Accounts whose last refresh failed are not retried for this many seconds,
+# so timer ticks don't keep hammering Firebase with a dead refresh token
+REFRESH_FAILURE_TTL = 300
+_refresh_failures = {}
+
+# Returned by _coalesced_refresh instead of a result while a recent failure is
+# cached; callers keep the account's last known health and limit
+REFRESH_SKIPPED = object()
+
+
+def _refresh_recently_failed(email):
+    """Whether a refresh for email failed within REFRESH_FAILURE_TTL seconds"""
+    failed_at = _refresh_failures.get(email)
+    if failed_at is None:
+        return False
+    if time.monotonic() - failed_at >= REFRESH_FAILURE_TTL:
+        _refresh_failures.pop(email, None)
+        return False
+    return True
+
+
+def _record_refresh_result(email, ok):
+    now = time.monotonic()
+    with _inflight_lock:
+        if ok:
+            _refresh_failures.pop(email, None)
+            return
+        # Keep the map small: drop expired entries before adding a new one
+        for key in [k for k, ts in _refresh_failures.items() if now - ts >= REFRESH_FAILURE_TTL]:
+            del _refresh_failures[key]
+        _refresh_failures[email] = now
+
+
+def forget_refresh_failure(email):
+    """Allow an immediate refresh again, e.g. after the account data was replaced"""
+    with _inflight_lock:
+        _refresh_failures.pop(email, None)
+
+
+def _coalesced_refresh(email, request, *args, force=False):
+    """Call request(*args) unless a refresh for email is running or recently failed (force skips the backoff)"""
+    with _inflight_lock:
+        if not force and _refresh_recently_failed(email):
+            return REFRESH_SKIPPED
+        future = _inflight_refreshes.get(email)
+        owner = future is None
+        if owner:
+            future = _inflight_refreshes[email] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        result = request(*args)
+        _record_refresh_result(email, bool(result))
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        _record_refresh_result(email, False)
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_refreshes.pop(email, None)
+
+
+# GetRequestLimitInfo answers keyed by a digest of the access token, so that
+# overlapping refreshes of the same account reuse a recent result
+LIMIT_INFO_TTL = 25
+LIMIT_INFO_CACHE_SIZE = 256
+_limit_info_cache = {}
+_limit_info_lock = threading.Lock()
+
+
+def _limit_info_key(access_token):
+    return hashlib.blake2b(access_token.encode('utf-8'), digest_size=16).digest()
+
+
+def get_cached_limit_info(access_token):
+    """Return limit info fetched for this token within LIMIT_INFO_TTL seconds, or None"""
+    key = _limit_info_key(access_token)
+    with _limit_info_lock:
+        entry = _limit_info_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] >= LIMIT_INFO_TTL:
+            del _limit_info_cache[key]
+            return None
+        return entry[0]
+
+
+def store_limit_info(access_token, limit_info):
+    """Remember limit info fetched for this token"""
+    now = time.monotonic()
+    with _limit_info_lock:
+        if len(_limit_info_cache) >= LIMIT_INFO_CACHE_SIZE:
+            # Drop expired entries first, then the oldest ones
+            for key in [k for k, (_info, ts) in _limit_info_cache.items() if now - ts >= LIMIT_INFO_TTL]:
+                del _limit_info_cache[key]
+            while len(_limit_info_cache) >= LIMIT_INFO_CACHE_SIZE:
+                del _limit_info_cache[next(iter(_limit_info_cache))]
+        _limit_info_cache[_limit_info_key(access_token)] = (limit_info, now)
+
+
+def invalidate_limit_info(access_token):
+    """Forget cached limit info for a token that has been replaced"""
+    with _limit_info_lock:
+        _limit_info_cache.pop(_limit_info_key(access_token), None)
+
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
-                             QWidget, QPushButton, QTableWidget, QTableWidgetItem,
+                             QWidget, QPushButton, QTableView,
                              QDialog, QTextEdit, QLabel, QMessageBox, QHeaderView,
-                             QProgressDialog, QAbstractItemView, QStatusBar, QMenu, QAction, QScrollArea, QComboBox, QTabWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject
-from PyQt5.QtGui import QFont
+                             QProgressDialog, QAbstractItemView, QStatusBar, QMenu, QAction, QScrollArea, QComboBox, QTabWidget,
+                             QStyledItemDelegate, QStyle)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QTimer, QObject, QEvent, QRectF,
+                          QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import QFont, QColor, QBrush, QPainter, QPen, QLinearGradient
 
 
+@functools.lru_cache(maxsize=1)
 def get_os_info():
-    """Get operating system information for API headers"""
+    """Get operating system information for API headers (probed once per process)"""
     import platform
 
     if IS_WINDOWS:
@@ -65,142 +284,480 @@ def get_os_info():
         }
 
 
+# GraphQL query behind both limit-info fetchers
+_LIMIT_INFO_QUERY = """
+query GetRequestLimitInfo($requestContext: RequestContext!) {
+  user(requestContext: $requestContext) {
+    __typename
+    ... on UserOutput {
+      user {
+        requestLimitInfo {
+          isUnlimited
+          nextRefreshTime
+          requestLimit
+          requestsUsedSinceLastRefresh
+          requestLimitRefreshDuration
+          isUnlimitedAutosuggestions
+          acceptedAutosuggestionsLimit
+          acceptedAutosuggestionsSinceLastRefresh
+          isUnlimitedVoice
+          voiceRequestLimit
+          voiceRequestsUsedSinceLastRefresh
+          voiceTokenLimit
+          voiceTokensUsedSinceLastRefresh
+          isUnlimitedCodebaseIndices
+          maxCodebaseIndices
+          maxFilesPerRepo
+          embeddingGenerationBatchSize
+        }
+      }
+    }
+    ... on UserFacingError {
+      error {
+        __typename
+        ... on SharedObjectsLimitExceeded {
+          limit
+          objectType
+          message
+        }
+        ... on PersonalObjectsLimitExceeded {
+          limit
+          objectType
+          message
+        }
+        ... on AccountDelinquencyError {
+          message
+        }
+        ... on GenericStringObjectUniqueKeyConflict {
+          message
+        }
+      }
+      responseContext {
+        serverVersion
+      }
+    }
+  }
+}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _limit_info_request():
+    """Return (headers without Authorization, JSON body) for GetRequestLimitInfo, built once"""
+    os_info = get_os_info()
+    headers = {
+        'Content-Type': 'application/json',
+        'X-Warp-Client-Version': 'v0.2025.08.27.08.11.stable_04',
+        'X-Warp-Os-Category': os_info['category'],
+        'X-Warp-Os-Name': os_info['name'],
+        'X-Warp-Os-Version': os_info['version'],
+        'Accept': '*/*',
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'X-Warp-Manager-Request': 'true'  # Identify request as originating from our application
+    }
+    payload = {
+        "query": _LIMIT_INFO_QUERY,
+        "variables": {
+            "requestContext": {
+                "clientContext": {
+                    "version": "v0.2025.08.27.08.11.stable_04"
+                },
+                "osContext": {
+                    "category": os_info['category'],
+                    "linuxKernelVersion": None,
+                    "name": os_info['category'],
+                    "version": os_info['version']
+                }
+            }
+        },
+        "operationName": "GetRequestLimitInfo"
+    }
+    return headers, _json_dumps_bytes(payload)
+
+
+def _extract_limit_info(data):
+    """Return requestLimitInfo from a GetRequestLimitInfo response, or None for errors"""
+    try:
+        # Only UserOutput carries user.requestLimitInfo; UserFacingError lands in the except
+        return data['data']['user']['user']['requestLimitInfo']
+    except (KeyError, TypeError):
+        return None
+
+
+def _locate_stylesheet():
+    """Resolve style.qss once, through importlib.resources when imported from a package"""
+    if __package__:
+        try:
+            from importlib.resources import files
+            return files(__package__).joinpath("style.qss")
+        except (ImportError, TypeError):
+            pass
+    # Plain script execution: the stylesheet sits next to this file
+    return Path(__file__).resolve().parent / "style.qss"
+
+
+_STYLESHEET_RESOURCE = _locate_stylesheet()
+
+# Stylesheet text and the style.qss mtime it was read at
+_STYLESHEET_CACHE = None
+_STYLESHEET_MTIME = 0
+
+
 def load_stylesheet(app):
     """Apply the modern compact QSS stylesheet if it exists."""
+    global _STYLESHEET_CACHE, _STYLESHEET_MTIME
     try:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        style_path = os.path.join(base_dir, "style.qss")
-        if os.path.exists(style_path):
-            with open(style_path, "r", encoding="utf-8") as f:
-                app.setStyleSheet(f.read())
+        style = _STYLESHEET_RESOURCE
+        if isinstance(style, Path):
+            try:
+                mtime = style.stat().st_mtime
+            except FileNotFoundError:
+                return
+        elif style.is_file():
+            # Resources inside a zip or frozen bundle cannot change at runtime
+            mtime = _STYLESHEET_MTIME
+        else:
+            return
+
+        # Re-read only when the file changed since the last load
+        if _STYLESHEET_CACHE is None or mtime != _STYLESHEET_MTIME:
+            _STYLESHEET_CACHE = style.read_text(encoding="utf-8")
+            _STYLESHEET_MTIME = mtime
+        app.setStyleSheet(_STYLESHEET_CACHE)
     except Exception as e:
         print(f"{_('stylesheet_load_error', e)}")
 
 
+class HealthStatus(IntEnum):
+    """Account health states, stored as integers in accounts.health_code"""
+    UNKNOWN = 0
+    HEALTHY = 1
+    UNHEALTHY = 2
+    BANNED = 3
+
+
+# health_code -> canonical health_status text (written alongside health_code for older readers)
+HEALTH_NAMES = tuple(status.name.lower() for status in HealthStatus)
+# health_code -> HealthStatus; accounts.health_code is the source of truth for every reader
+HEALTH_STATUSES = tuple(HealthStatus)
+
+
+@functools.lru_cache(maxsize=1)
+def _legacy_health_labels():
+    """Translated health labels of every bundled language, mapped to their HealthStatus"""
+    manager = get_language_manager()
+    labels = {}
+    for language in manager.get_available_languages():
+        labels[manager.get_text_in(language, 'status_healthy')] = HealthStatus.HEALTHY
+        labels[manager.get_text_in(language, 'status_unhealthy')] = HealthStatus.UNHEALTHY
+        labels[manager.get_text_in(language, 'status_banned_key')] = HealthStatus.BANNED
+    return labels
+
+
+def health_code(health_status):
+    """Map a HealthStatus or health_status text to its integer code"""
+    if isinstance(health_status, HealthStatus):
+        return health_status
+    try:
+        return HealthStatus[health_status.upper()]
+    except (KeyError, AttributeError):
+        # Older versions stored labels translated into whichever language was active
+        # (e.g. "tidak sehat"), so match them against every catalog
+        return _legacy_health_labels().get(health_status, HealthStatus.UNKNOWN)
+
+
 class AccountManager:
     def __init__(self):
         self.db_path = "accounts.db"
+        # One long-lived connection per manager; the lock serializes access
+        # from worker threads and the bridge server
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        # Rows still unpack like tuples but can also be read by column name
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-64000')
+        self._has_json_patch = self._probe_json_patch()
+        # proxy_settings values read so far (None = key absent); setters write through
+        self._settings_cache = {}
+        # email -> (account_json, parsed dict); reused while the stored JSON is unchanged
+        self._parsed_accounts = {}
         self.init_database()
 
-    def init_database(self):
-        """Initialize the database and create required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS accounts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                account_data TEXT NOT NULL,
-                health_status TEXT DEFAULT 'healthy',
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Add health_status column if it does not exist
+    def _probe_json_patch(self):
+        """Check whether this SQLite build ships the JSON1 json_patch() function"""
         try:
-            cursor.execute('ALTER TABLE accounts ADD COLUMN health_status TEXT DEFAULT "healthy"')
+            self._conn.execute("SELECT json_patch('{}', '{}')")
+            return True
         except sqlite3.OperationalError:
-            # Column already exists
-            pass
+            return False
 
-        # Add limit_info column if it doesn't exist
+    @contextmanager
+    def _transaction(self):
+        """Run several statements atomically on the shared connection"""
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def _execute(self, sql, params=()):
+        """Execute a single autocommitted statement"""
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def _fetchone(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _iter_rows(self, sql, params=(), batch_size=64):
+        """Yield rows lazily, holding the lock only while each batch is fetched"""
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
         try:
-            cursor.execute('ALTER TABLE accounts ADD COLUMN limit_info TEXT DEFAULT "Not Updated"')
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS proxy_settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-        ''')
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            with self._lock:
+                cursor.close()
+
+    def _get_setting(self, key):
+        """Return a proxy_settings value, querying SQLite only on first use"""
+        if key not in self._settings_cache:
+            result = self._fetchone('SELECT value FROM proxy_settings WHERE key = ?', (key,))
+            self._settings_cache[key] = result[0] if result else None
+        return self._settings_cache[key]
+
+    def invalidate_settings_cache(self):
+        """Forget cached settings after another process changed proxy_settings"""
+        self._settings_cache.clear()
+
+    def init_database(self):
+        """Initialize the database and create required tables"""
+        with self._transaction() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS accounts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    email TEXT UNIQUE NOT NULL,
+                    account_data TEXT NOT NULL,
+                    health_status TEXT DEFAULT 'healthy',
+                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Add columns introduced after the first release, only when missing
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(accounts)')}
+            if 'health_status' not in columns:
+                conn.execute('ALTER TABLE accounts ADD COLUMN health_status TEXT DEFAULT "healthy"')
+            if 'limit_info' not in columns:
+                conn.execute('ALTER TABLE accounts ADD COLUMN limit_info TEXT DEFAULT "Not Updated"')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS proxy_settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                ) WITHOUT ROWID
+            ''')
+
+            # Schema version 1: proxy_settings is a pure key/value table, so rebuild
+            # databases created before that as WITHOUT ROWID (one B-tree instead of two)
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < 1:
+                conn.execute('''
+                    CREATE TABLE proxy_settings_new (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL
+                    ) WITHOUT ROWID
+                ''')
+                conn.execute('INSERT INTO proxy_settings_new (key, value) SELECT key, value FROM proxy_settings')
+                conn.execute('DROP TABLE proxy_settings')
+                conn.execute('ALTER TABLE proxy_settings_new RENAME TO proxy_settings')
+                conn.execute('PRAGMA user_version = 1')
+
+            # Schema version 2: mirror the token expiration into its own column so
+            # the account list can be rendered without loading account_data
+            if version < 2:
+                conn.execute('ALTER TABLE accounts ADD COLUMN token_expiry INTEGER')
+                rows = conn.execute('SELECT email, account_data FROM accounts').fetchall()
+                updates = []
+                for email, account_json in rows:
+                    try:
+                        updates.append((self._token_expiry(_json_loads(account_json)), email))
+                    except (ValueError, AttributeError):
+                        continue
+                conn.executemany('UPDATE accounts SET token_expiry = ? WHERE email = ?', updates)
+                conn.execute('PRAGMA user_version = 2')
+
+            # Schema version 3: account_data is stored as compact JSON; re-encode
+            # rows saved verbatim (often pretty-printed) by earlier versions
+            if version < 3:
+                rows = conn.execute('SELECT email, account_data FROM accounts').fetchall()
+                updates = []
+                for email, account_json in rows:
+                    try:
+                        compact_json = _json_dumps(_json_loads(account_json))
+                    except ValueError:
+                        continue
+                    if compact_json != account_json:
+                        updates.append((compact_json, email))
+                conn.executemany('UPDATE accounts SET account_data = ? WHERE email = ?', updates)
+                conn.execute('PRAGMA user_version = 3')
+
+            # Schema version 4: health is stored as a HealthStatus integer, with
+            # health_status kept as its canonical name for the proxy script and UI
+            if version < 4:
+                conn.execute('ALTER TABLE accounts ADD COLUMN health_code INTEGER NOT NULL DEFAULT 1')
+                rows = conn.execute('SELECT email, health_status FROM accounts').fetchall()
+                updates = []
+                for email, health_status in rows:
+                    code = health_code(health_status)
+                    updates.append((code, HEALTH_NAMES[code], email))
+                conn.executemany('UPDATE accounts SET health_code = ?, health_status = ? WHERE email = ?', updates)
+                conn.execute('PRAGMA user_version = 4')
+
+            # Insert default value for certificate approval status
+            conn.execute('''
+                INSERT OR IGNORE INTO proxy_settings (key, value)
+                VALUES ('certificate_approved', 'false')
+            ''')
+
+    @staticmethod
+    def _utc_timestamp():
+        """Return the current UTC time in SQLite's CURRENT_TIMESTAMP format"""
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
 
-        # Insert default value for certificate approval status
-        cursor.execute('''
-            INSERT OR IGNORE INTO proxy_settings (key, value)
-            VALUES ('certificate_approved', 'false')
-        ''')
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def _token_expiry(account_data):
+        """Return the token expiration (ms) stored in the token_expiry column"""
+        token_manager = account_data.get('stsTokenManager')
+        return token_manager.get('expirationTime') if isinstance(token_manager, dict) else None
 
     def add_account(self, account_json):
         """Add an account from JSON data"""
         try:
-            account_data = json.loads(account_json)
+            account_data = _json_loads(account_json)
             email = account_data.get('email')
 
             if not email:
                 raise ValueError(_('email_not_found'))
 
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO accounts (email, account_data, last_updated)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (email, account_json))
-            conn.commit()
-            conn.close()
+            self._execute('''
+                INSERT OR REPLACE INTO accounts (email, account_data, token_expiry, last_updated)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (email, _json_dumps(account_data), self._token_expiry(account_data)))
+            self._parsed_accounts.pop(email, None)
+            forget_refresh_failure(email)
             return True, _('account_added_success')
         except json.JSONDecodeError:
             return False, _('invalid_json')
         except Exception as e:
             return False, f"{_('error')}: {str(e)}"
 
+    def add_accounts_many(self, accounts):
+        """Add several accounts (JSON strings or dicts) in a single transaction"""
+        try:
+            # Validate everything first so a bad entry leaves the database untouched
+            rows = []
+            for account in accounts:
+                account_data = _json_loads(account) if isinstance(account, str) else account
+                email = account_data.get('email')
+
+                if not email:
+                    raise ValueError(_('email_not_found'))
+
+                rows.append((email, _json_dumps(account_data), self._token_expiry(account_data)))
+
+            with self._transaction() as conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO accounts (email, account_data, token_expiry, last_updated)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ''', rows)
+            for row in rows:
+                self._parsed_accounts.pop(row[0], None)
+                forget_refresh_failure(row[0])
+            return True, _('accounts_added_success', len(rows))
+        except json.JSONDecodeError:
+            return False, _('invalid_json')
+        except Exception as e:
+            return False, f"{_('error')}: {str(e)}"
+
+    def iter_accounts(self):
+        """Iterate over stored accounts without materializing every row"""
+        return self._iter_rows('SELECT email, account_data FROM accounts ORDER BY email')
+
     def get_accounts(self):
         """Return all stored accounts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT email, account_data FROM accounts ORDER BY email')
-        accounts = cursor.fetchall()
-        conn.close()
-        return accounts
+        return list(self.iter_accounts())
+
+    def iter_accounts_with_health(self):
+        """Iterate over (email, account JSON, HealthStatus) rows"""
+        return ((email, account_json, HEALTH_STATUSES[code]) for email, account_json, code
+                in self._iter_rows('SELECT email, account_data, health_code FROM accounts ORDER BY email'))
 
     def get_accounts_with_health(self):
         """Return all accounts including their health status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT email, account_data, health_status FROM accounts ORDER BY email')
-        accounts = cursor.fetchall()
-        conn.close()
-        return accounts
+        return list(self.iter_accounts_with_health())
 
     def update_account_health(self, email, health_status):
-        """Update the stored health status for an account"""
+        """Update the stored health status (HealthStatus or its name) for an account"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE accounts SET health_status = ?, last_updated = CURRENT_TIMESTAMP
+            code = health_code(health_status)
+            self._execute('''
+                UPDATE accounts SET health_code = ?, health_status = ?, last_updated = CURRENT_TIMESTAMP
                 WHERE email = ?
-            ''', (health_status, email))
-            conn.commit()
-            conn.close()
+            ''', (code, HEALTH_NAMES[code], email))
             return True
         except Exception as e:
             print(f"Health status update error: {e}")
             return False
 
+    def update_account_health_many(self, rows):
+        """Update health status for many (email, health_status) pairs in one transaction"""
+        return self.bulk_update((email, health_status, None, None) for email, health_status in rows)
+
     def update_account_token(self, email, new_token_data):
         """Update token details for an account"""
+        self._parsed_accounts.pop(email, None)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT account_data FROM accounts WHERE email = ?', (email,))
-            result = cursor.fetchone()
+            if self._has_json_patch:
+                # Merge the token delta inside SQLite instead of round-tripping the JSON
+                patch = _json_dumps({'stsTokenManager': new_token_data})
+                cursor = self._execute('''
+                    UPDATE accounts SET account_data = json_patch(account_data, ?),
+                        token_expiry = COALESCE(?, token_expiry), last_updated = CURRENT_TIMESTAMP
+                    WHERE email = ?
+                ''', (patch, new_token_data.get('expirationTime'), email))
+                if cursor.rowcount > 0:
+                    forget_refresh_failure(email)
+                    return True
+                return False
+
+            with self._transaction() as conn:
+                result = conn.execute('SELECT account_data FROM accounts WHERE email = ?', (email,)).fetchone()
+                if not result:
+                    return False
 
-            if result:
-                account_data = json.loads(result[0])
+                account_data = _json_loads(result[0])
                 account_data['stsTokenManager'].update(new_token_data)
 
-                cursor.execute('''
-                    UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP
+                conn.execute('''
+                    UPDATE accounts SET account_data = ?, token_expiry = ?, last_updated = CURRENT_TIMESTAMP
                     WHERE email = ?
-                ''', (json.dumps(account_data), email))
-                conn.commit()
-                conn.close()
-                return True
-            return False
+                ''', (_json_dumps(account_data), self._token_expiry(account_data), email))
+            forget_refresh_failure(email)
+            return True
         except Exception as e:
             print(f"Token update error: {e}")
             return False
@@ -208,14 +765,13 @@ class AccountManager:
     def update_account(self, email, updated_json):
         """Replace all account data using a JSON string"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP
+            account_data = _json_loads(updated_json)
+            self._execute('''
+                UPDATE accounts SET account_data = ?, token_expiry = ?, last_updated = CURRENT_TIMESTAMP
                 WHERE email = ?
-            ''', (updated_json, email))
-            conn.commit()
-            conn.close()
+            ''', (_json_dumps(account_data), self._token_expiry(account_data), email))
+            self._parsed_accounts.pop(email, None)
+            forget_refresh_failure(email)
             return True
         except Exception as e:
             print(f"Account update error: {e}")
@@ -224,14 +780,11 @@ class AccountManager:
     def set_active_account(self, email):
         """Mark an account as active"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
+            self._execute('''
                 INSERT OR REPLACE INTO proxy_settings (key, value)
                 VALUES ('active_account', ?)
             ''', (email,))
-            conn.commit()
-            conn.close()
+            self._settings_cache['active_account'] = email
             return True
         except Exception as e:
             print(f"Active account assignment error: {e}")
@@ -240,23 +793,15 @@ class AccountManager:
     def get_active_account(self):
         """Return the currently active account"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT value FROM proxy_settings WHERE key = ?', ('active_account',))
-            result = cursor.fetchone()
-            conn.close()
-            return result[0] if result else None
-        except:
+            return self._get_setting('active_account')
+        except sqlite3.Error:
             return None
 
     def clear_active_account(self):
         """Clear the active account flag"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
-            conn.commit()
-            conn.close()
+            self._execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
+            self._settings_cache['active_account'] = None
             return True
         except Exception as e:
             print(f"Active account clearing error: {e}")
@@ -264,21 +809,17 @@ class AccountManager:
 
     def delete_account(self, email):
         """Delete an account"""
+        self._parsed_accounts.pop(email, None)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Remove the account from the table
-            cursor.execute('DELETE FROM accounts WHERE email = ?', (email,))
-
-            # If the deleted account was active, clear the active account entry
-            cursor.execute('SELECT value FROM proxy_settings WHERE key = ?', ('active_account',))
-            result = cursor.fetchone()
-            if result and result[0] == email:
-                cursor.execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
-
-            conn.commit()
-            conn.close()
+            with self._transaction() as conn:
+                # Remove the account from the table
+                conn.execute('DELETE FROM accounts WHERE email = ?', (email,))
+
+                # If the deleted account was active, clear the active account entry
+                result = conn.execute('SELECT value FROM proxy_settings WHERE key = ?', ('active_account',)).fetchone()
+                if result and result[0] == email:
+                    conn.execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
+                    self._settings_cache.pop('active_account', None)
             return True
         except Exception as e:
             print(f"Account deletion error: {e}")
@@ -287,60 +828,221 @@ class AccountManager:
     def update_account_limit_info(self, email, limit_info):
         """Update cached limit information for an account"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
+            self._execute('''
                 UPDATE accounts SET limit_info = ?, last_updated = CURRENT_TIMESTAMP
                 WHERE email = ?
             ''', (limit_info, email))
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Limit information update error: {e}")
             return False
 
+    def update_account_limit_info_many(self, rows):
+        """Update limit information for many (email, limit_info) pairs in one transaction"""
+        return self.bulk_update((email, None, limit_info, None) for email, limit_info in rows)
+
+    def bulk_update(self, updates):
+        """Apply (email, health_status, limit_info, token_data) updates in one transaction; None fields are left as-is"""
+        try:
+            now = self._utc_timestamp()
+            health_params = []
+            limit_params = []
+            token_updates = []
+            for email, health_status, limit_info, token_data in updates:
+                if health_status is not None:
+                    code = health_code(health_status)
+                    health_params.append((code, HEALTH_NAMES[code], now, email))
+                if limit_info is not None:
+                    limit_params.append((limit_info, now, email))
+                if token_data is not None:
+                    token_updates.append((email, token_data))
+
+            with self._transaction() as conn:
+                conn.executemany('''
+                    UPDATE accounts SET health_code = ?, health_status = ?, last_updated = ?
+                    WHERE email = ?
+                ''', health_params)
+                conn.executemany('''
+                    UPDATE accounts SET limit_info = ?, last_updated = ?
+                    WHERE email = ?
+                ''', limit_params)
+
+                if self._has_json_patch:
+                    conn.executemany('''
+                        UPDATE accounts SET account_data = json_patch(account_data, ?),
+                            token_expiry = COALESCE(?, token_expiry), last_updated = ?
+                        WHERE email = ?
+                    ''', [(_json_dumps({'stsTokenManager': token_data}), token_data.get('expirationTime'), now, email)
+                          for email, token_data in token_updates])
+                else:
+                    for email, token_data in token_updates:
+                        result = conn.execute('SELECT account_data FROM accounts WHERE email = ?', (email,)).fetchone()
+                        if not result:
+                            continue
+                        account_data = _json_loads(result[0])
+                        account_data['stsTokenManager'].update(token_data)
+                        conn.execute('''
+                            UPDATE accounts SET account_data = ?, token_expiry = ?, last_updated = ?
+                            WHERE email = ?
+                        ''', (_json_dumps(account_data), self._token_expiry(account_data), now, email))
+
+            for email, _token_data in token_updates:
+                self._parsed_accounts.pop(email, None)
+                forget_refresh_failure(email)
+            return True
+        except Exception as e:
+            print(f"Bulk account update error: {e}")
+            return False
+
+    def iter_accounts_with_health_and_limits(self):
+        """Iterate over (email, account JSON, HealthStatus, limit info) rows"""
+        return ((email, account_json, HEALTH_STATUSES[code], limit_info) for email, account_json, code, limit_info
+                in self._iter_rows('SELECT email, account_data, health_code, limit_info FROM accounts ORDER BY email'))
+
     def get_accounts_with_health_and_limits(self):
         """Return all accounts with health status and limit information"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT email, account_data, health_status, limit_info FROM accounts ORDER BY email')
-        accounts = cursor.fetchall()
-        conn.close()
-        return accounts
+        return list(self.iter_accounts_with_health_and_limits())
+
+    def get_account_summaries(self):
+        """Return (email, token_expiry, HealthStatus, limit_info) rows without the JSON blob"""
+        rows = self._fetchall('SELECT email, token_expiry, health_code, limit_info FROM accounts ORDER BY email')
+        return [(email, token_expiry, HEALTH_STATUSES[code], limit_info)
+                for email, token_expiry, code, limit_info in rows]
+
+    def get_account_summary(self, email):
+        """Return the (email, token_expiry, HealthStatus, limit_info) row for one account, or None"""
+        result = self._fetchone('SELECT email, token_expiry, health_code, limit_info FROM accounts WHERE email = ?', (email,))
+        return (result[0], result[1], HEALTH_STATUSES[result[2]], result[3]) if result else None
+
+    def get_account_data(self, email):
+        """Return the stored JSON string for a single account, or None"""
+        result = self._fetchone('SELECT account_data FROM accounts WHERE email = ?', (email,))
+        return result[0] if result else None
+
+    def get_account_health(self, email):
+        """Return the HealthStatus of a single account, or None"""
+        result = self._fetchone('SELECT health_code FROM accounts WHERE email = ?', (email,))
+        return HEALTH_STATUSES[result[0]] if result else None
+
+    def get_account_with_health(self, email):
+        """Return (account JSON, HealthStatus) for a single account, or None"""
+        result = self._fetchone('SELECT account_data, health_code FROM accounts WHERE email = ?', (email,))
+        return (result[0], HEALTH_STATUSES[result[1]]) if result else None
+
+    def get_account_dict(self, email, account_json=None):
+        """Return parsed account data, skipping json.loads while the stored JSON is unchanged"""
+        if account_json is None:
+            account_json = self.get_account_data(email)
+            if account_json is None:
+                return None
+
+        # The raw JSON is the cache key: last_updated only has one-second
+        # resolution and the proxy script rewrites rows behind our back
+        cached = self._parsed_accounts.get(email)
+        if cached is not None and cached[0] == account_json:
+            return cached[1]
+
+        account_data = _json_loads(account_json)
+        self._parsed_accounts[email] = (account_json, account_data)
+        return account_data
 
     def is_certificate_approved(self):
         """Check whether certificate approval was previously recorded"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT value FROM proxy_settings WHERE key = ?', ('certificate_approved',))
-            result = cursor.fetchone()
-            conn.close()
-            return result and result[0] == 'true'
-        except:
+            return self._get_setting('certificate_approved') == 'true'
+        except sqlite3.Error:
             return False
 
     def set_certificate_approved(self, approved=True):
         """Persist certificate approval state in the database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
+            self._execute('''
                 INSERT OR REPLACE INTO proxy_settings (key, value)
                 VALUES ('certificate_approved', ?)
             ''', ('true' if approved else 'false',))
-            conn.commit()
-            conn.close()
+            self._settings_cache['certificate_approved'] = 'true' if approved else 'false'
             return True
         except Exception as e:
             print(f"Certificate approval save error: {e}")
             return False
 
 
+# Process-wide AccountManager shared by the main window and background workers
+_default_account_manager = None
+
+
+def get_default_account_manager():
+    """Return the shared AccountManager instance, creating it on first use"""
+    global _default_account_manager
+    if _default_account_manager is None:
+        _default_account_manager = AccountManager()
+    return _default_account_manager
+
+
 class ProxyManager:
     """Cross-platform proxy settings manager"""
 
+    # Service lines in `networksetup -listnetworkserviceorder`, e.g. "(1) Wi-Fi"
+    _SERVICE_RE = re.compile(r"^\([^)\n]+\) +(.+)$", re.M)
+    _IGNORED_SERVICES = frozenset({'Bluetooth PAN', 'Thunderbolt Bridge'})
+
+    # First usable macOS network service, detected once and reused
+    _primary_service = None
+
+    @staticmethod
+    def _parse_services(stdout):
+        """Extract usable network service names from networksetup output"""
+        return [service for service in ProxyManager._SERVICE_RE.findall(stdout)
+                if service not in ProxyManager._IGNORED_SERVICES]
+
+    # (service, PAC URL) last applied successfully by _set_proxy_macos
+    _applied_pac = None
+
+    # HKCU Internet Settings handle, opened once and closed at exit
+    _ie_key = None
+
+    @staticmethod
+    def _get_internet_settings_key():
+        """Return the cached Windows Internet Settings registry key"""
+        if ProxyManager._ie_key is None:
+            ProxyManager._ie_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                                  r"Software\Microsoft\Windows\CurrentVersion\Internet Settings",
+                                                  0, winreg.KEY_SET_VALUE | winreg.KEY_READ)
+            atexit.register(winreg.CloseKey, ProxyManager._ie_key)
+        return ProxyManager._ie_key
+
+    @staticmethod
+    def _get_primary_service():
+        """Return the primary macOS network service (usually Wi-Fi or Ethernet)"""
+        if ProxyManager._primary_service is None:
+            result = subprocess.run(["networksetup", "-listnetworkserviceorder"],
+                                  capture_output=True, text=True, timeout=10)
+
+            if result.returncode != 0:
+                print("Failed to get network services")
+                return None
+
+            # Find the first active service
+            services = ProxyManager._parse_services(result.stdout)
+            if services:
+                ProxyManager._primary_service = services[0]
+
+        return ProxyManager._primary_service
+
+    @staticmethod
+    def _reset_primary_service():
+        """Forget the cached network service so the next call detects it again"""
+        ProxyManager._primary_service = None
+
+    @staticmethod
+    def _run_networksetup_parallel(commands):
+        """Run independent networksetup commands concurrently, returning results in order"""
+        def run(args):
+            return subprocess.run(["networksetup", *args], capture_output=True, text=True, timeout=10)
+
+        with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+            return list(pool.map(run, commands))
+
     @staticmethod
     def set_proxy(proxy_server):
         """Enable proxy settings"""
@@ -358,22 +1060,18 @@ class ProxyManager:
             if winreg is None:
                 return False
 
-            # Registry key opening
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                               r"Software\Microsoft\Windows\CurrentVersion\Internet Settings",
-                               0, winreg.KEY_SET_VALUE)
+            key = ProxyManager._get_internet_settings_key()
 
             # Set proxy settings
             winreg.SetValueEx(key, "ProxyEnable", 0, winreg.REG_DWORD, 1)
             winreg.SetValueEx(key, "ProxyServer", 0, winreg.REG_SZ, proxy_server)
 
-            winreg.CloseKey(key)
-
             # Refresh Internet Explorer settings (silently)
             try:
                 subprocess.run(["rundll32.exe", "wininet.dll,InternetSetOption", "0", "37", "0", "0"],
-                             shell=True, capture_output=True, timeout=5)
-            except:
+                             capture_output=True, timeout=5,
+                             creationflags=subprocess.CREATE_NO_WINDOW)
+            except (OSError, subprocess.SubprocessError):
                 # If silent refresh doesn't work, inform user
                 pass
 
@@ -402,43 +1100,40 @@ class ProxyManager:
     return "DIRECT";
 }}"""
 
-            # Write PAC file
-            import tempfile
-            import os
-            pac_dir = os.path.expanduser("~/.warp_proxy")
-            os.makedirs(pac_dir, exist_ok=True)
-            pac_file = os.path.join(pac_dir, "warp_proxy.pac")
-
-            with open(pac_file, 'w') as f:
-                f.write(pac_content)
+            # Write PAC file, skipping the write when the content is already on disk
+            WARP_PROXY_DIR.mkdir(parents=True, exist_ok=True)
+            pac_file = str(PAC_FILE)
+            pac_bytes = pac_content.encode('utf-8')
 
-            print(f"PAC file created: {pac_file}")
+            try:
+                with open(pac_file, 'rb') as f:
+                    pac_changed = f.read() != pac_bytes
+            except OSError:
+                pac_changed = True
+
+            if pac_changed:
+                # Write to a temporary file and swap it in atomically
+                tmp_file = pac_file + ".tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(pac_bytes)
+                os.replace(tmp_file, pac_file)
+                print(f"PAC file created: {pac_file}")
 
             # Get active network service
-            result = subprocess.run(["networksetup", "-listnetworkserviceorder"],
-                                  capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
-                print("Failed to get network services")
-                return False
-
-            # Find the first active service (usually Wi-Fi or Ethernet)
-            services = []
-            for line in result.stdout.split('\n'):
-                if line.startswith('(') and ')' in line:
-                    service_name = line.split(') ')[1] if ') ' in line else None
-                    if service_name and service_name not in ['Bluetooth PAN', 'Thunderbolt Bridge']:
-                        services.append(service_name)
-
-            if not services:
+            primary_service = ProxyManager._get_primary_service()
+            if not primary_service:
                 print("No suitable network service found")
                 return False
 
-            primary_service = services[0]
+            # Nothing to do if this exact PAC setup was already applied
+            pac_url = f"file://{pac_file}"
+            if not pac_changed and ProxyManager._applied_pac == (primary_service, pac_url):
+                print(f"PAC proxy already configured: {proxy_server}")
+                return True
+
             print(f"Configuring PAC proxy for service: {primary_service}")
 
             # Set Auto Proxy Configuration (PAC)
-            pac_url = f"file://{pac_file}"
             result1 = subprocess.run(["networksetup", "-setautoproxyurl", primary_service, pac_url],
                                    capture_output=True, text=True, timeout=10)
 
@@ -447,17 +1142,23 @@ class ProxyManager:
                                    capture_output=True, text=True, timeout=10)
 
             if result1.returncode == 0 and result2.returncode == 0:
+                ProxyManager._applied_pac = (primary_service, pac_url)
                 print(f"PAC proxy configured successfully: {proxy_server}")
                 print("✅ Internet access preserved - only Warp traffic goes through proxy")
                 return True
             else:
+                ProxyManager._applied_pac = None
                 print(f"PAC proxy configuration failed. PAC: {result1.stderr}, Enable: {result2.stderr}")
+                # The network service may have changed since it was cached
+                ProxyManager._reset_primary_service()
                 # Fallback to manual proxy if PAC fails
                 print("Falling back to manual proxy configuration...")
                 return ProxyManager._set_proxy_macos_manual(proxy_server)
 
         except Exception as e:
             print(f"macOS PAC proxy setup error: {e}")
+            ProxyManager._applied_pac = None
+            ProxyManager._reset_primary_service()
             # Fallback to manual proxy
             print("Falling back to manual proxy configuration...")
             return ProxyManager._set_proxy_macos_manual(proxy_server)
@@ -469,26 +1170,11 @@ class ProxyManager:
             host, port = proxy_server.split(":")
 
             # Get active network service
-            result = subprocess.run(["networksetup", "-listnetworkserviceorder"],
-                                  capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
-                print("Failed to get network services")
-                return False
-
-            # Find the first active service (usually Wi-Fi or Ethernet)
-            services = []
-            for line in result.stdout.split('\n'):
-                if line.startswith('(') and ')' in line:
-                    service_name = line.split(') ')[1] if ') ' in line else None
-                    if service_name and service_name not in ['Bluetooth PAN', 'Thunderbolt Bridge']:
-                        services.append(service_name)
-
-            if not services:
+            primary_service = ProxyManager._get_primary_service()
+            if not primary_service:
                 print("No suitable network service found")
                 return False
 
-            primary_service = services[0]
             print(f"Configuring manual proxy for service: {primary_service}")
 
             # Set HTTP proxy
@@ -505,6 +1191,7 @@ class ProxyManager:
                 return True
             else:
                 print(f"Manual proxy configuration failed. HTTP: {result1.stderr}, HTTPS: {result2.stderr}")
+                ProxyManager._reset_primary_service()
                 return False
 
         except Exception as e:
@@ -528,15 +1215,10 @@ class ProxyManager:
             if winreg is None:
                 return False
 
-            # Open registry key
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                               r"Software\Microsoft\Windows\CurrentVersion\Internet Settings",
-                               0, winreg.KEY_SET_VALUE)
+            key = ProxyManager._get_internet_settings_key()
 
             # Disable proxy
             winreg.SetValueEx(key, "ProxyEnable", 0, winreg.REG_DWORD, 0)
-
-            winreg.CloseKey(key)
             return True
         except Exception as e:
             print(f"Proxy disable error: {e}")
@@ -547,51 +1229,35 @@ class ProxyManager:
         """Disable macOS proxy settings (both PAC and manual)"""
         try:
             # Get active network service
-            result = subprocess.run(["networksetup", "-listnetworkserviceorder"],
-                                  capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
-                print("Failed to get network services")
-                return False
-
-            # Find the first active service
-            services = []
-            for line in result.stdout.split('\n'):
-                if line.startswith('(') and ')' in line:
-                    service_name = line.split(') ')[1] if ') ' in line else None
-                    if service_name and service_name not in ['Bluetooth PAN', 'Thunderbolt Bridge']:
-                        services.append(service_name)
-
-            if not services:
+            primary_service = ProxyManager._get_primary_service()
+            if not primary_service:
                 print("No suitable network service found")
                 return False
 
-            primary_service = services[0]
             print(f"Disabling proxy for service: {primary_service}")
+            ProxyManager._applied_pac = None
 
             success_count = 0
 
-            # Disable Auto Proxy (PAC)
-            result1 = subprocess.run(["networksetup", "-setautoproxystate", primary_service, "off"],
-                                   capture_output=True, text=True, timeout=10)
+            # Disable Auto Proxy (PAC), HTTP and HTTPS proxies at the same time
+            result1, result2, result3 = ProxyManager._run_networksetup_parallel([
+                ["-setautoproxystate", primary_service, "off"],
+                ["-setwebproxystate", primary_service, "off"],
+                ["-setsecurewebproxystate", primary_service, "off"],
+            ])
+
             if result1.returncode == 0:
                 success_count += 1
                 print("✅ Auto Proxy (PAC) disabled")
             else:
                 print(f"⚠️ Auto Proxy disable failed: {result1.stderr}")
 
-            # Disable HTTP proxy
-            result2 = subprocess.run(["networksetup", "-setwebproxystate", primary_service, "off"],
-                                   capture_output=True, text=True, timeout=10)
             if result2.returncode == 0:
                 success_count += 1
                 print("✅ HTTP Proxy disabled")
             else:
                 print(f"⚠️ HTTP Proxy disable failed: {result2.stderr}")
 
-            # Disable HTTPS proxy
-            result3 = subprocess.run(["networksetup", "-setsecurewebproxystate", primary_service, "off"],
-                                   capture_output=True, text=True, timeout=10)
             if result3.returncode == 0:
                 success_count += 1
                 print("✅ HTTPS Proxy disabled")
@@ -600,10 +1266,8 @@ class ProxyManager:
 
             # Clean up PAC file
             try:
-                import os
-                pac_file = os.path.expanduser("~/.warp_proxy/warp_proxy.pac")
-                if os.path.exists(pac_file):
-                    os.remove(pac_file)
+                if PAC_FILE.exists():
+                    PAC_FILE.unlink()
                     print("✅ PAC file cleaned up")
             except Exception as e:
                 print(f"⚠️ PAC file cleanup failed: {e}")
@@ -637,15 +1301,11 @@ class ProxyManager:
             if winreg is None:
                 return False
 
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                               r"Software\Microsoft\Windows\CurrentVersion\Internet Settings",
-                               0, winreg.KEY_READ)
-
-            proxy_enable, _ = winreg.QueryValueEx(key, "ProxyEnable")
-            winreg.CloseKey(key)
+            key = ProxyManager._get_internet_settings_key()
+            proxy_enable, _value_type = winreg.QueryValueEx(key, "ProxyEnable")
 
             return bool(proxy_enable)
-        except:
+        except OSError:
             return False
 
     @staticmethod
@@ -653,38 +1313,23 @@ class ProxyManager:
         """Check if proxy is enabled on macOS (PAC or manual)"""
         try:
             # Get active network service
-            result = subprocess.run(["networksetup", "-listnetworkserviceorder"],
-                                  capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
+            primary_service = ProxyManager._get_primary_service()
+            if not primary_service:
                 return False
 
-            # Find the first active service
-            services = []
-            for line in result.stdout.split('\n'):
-                if line.startswith('(') and ')' in line:
-                    service_name = line.split(') ')[1] if ') ' in line else None
-                    if service_name and service_name not in ['Bluetooth PAN', 'Thunderbolt Bridge']:
-                        services.append(service_name)
-
-            if not services:
-                return False
-
-            primary_service = services[0]
+            # Query Auto Proxy (PAC) and HTTP proxy state concurrently
+            result1, result2 = ProxyManager._run_networksetup_parallel([
+                ["-getautoproxyurl", primary_service],
+                ["-getwebproxy", primary_service],
+            ])
 
             # Check Auto Proxy (PAC) state
-            result1 = subprocess.run(["networksetup", "-getautoproxyurl", primary_service],
-                                  capture_output=True, text=True, timeout=10)
-
             if result1.returncode == 0:
                 if "Enabled: Yes" in result1.stdout:
                     print("PAC proxy is enabled")
                     return True
 
             # Check HTTP proxy state
-            result2 = subprocess.run(["networksetup", "-getwebproxy", primary_service],
-                                  capture_output=True, text=True, timeout=10)
-
             if result2.returncode == 0:
                 if "Enabled: Yes" in result2.stdout:
                     print("HTTP proxy is enabled")
@@ -705,23 +1350,47 @@ class CertificateManager:
     """Manage mitmproxy certificate generation and installation"""
 
     def __init__(self):
-        self.mitmproxy_dir = Path.home() / ".mitmproxy"
+        self.mitmproxy_dir = MITMPROXY_CONFDIR
         # Windows uses .cer, Linux commonly uses .pem
         self.cert_file = self.mitmproxy_dir / ("mitmproxy-ca-cert.cer" if IS_WINDOWS else "mitmproxy-ca-cert.pem")
+        self._cert_path = str(self.cert_file)
+        # Last existence check result and when it was taken (monotonic seconds)
+        self._cert_exists_cache = None
+        self._cert_exists_ts = 0
+        # Last macOS keychain trust check result, kept for 60 seconds
+        self._trust_cache = None
+        self._trust_ts = 0
 
     def check_certificate_exists(self):
-        """Return True if the certificate file exists"""
-        return self.cert_file.exists()
+        """Return True if the certificate file exists (re-checked at most every 5 seconds)"""
+        now = time.monotonic()
+        if self._cert_exists_cache is None or now - self._cert_exists_ts >= 5:
+            self._cert_exists_cache = self.cert_file.exists()
+            self._cert_exists_ts = now
+        return self._cert_exists_cache
+
+    def invalidate_cache(self):
+        """Force the next existence and trust checks to look at the system again"""
+        self._cert_exists_cache = None
+        self._trust_cache = None
 
     def get_certificate_path(self):
         """Return the certificate file path as a string"""
-        return str(self.cert_file)
+        return self._cert_path
 
     def verify_certificate_trust_macos(self):
-        """Verify if certificate is properly trusted on macOS"""
+        """Verify if certificate is properly trusted on macOS (re-checked at most every 60 seconds)"""
         if IS_WINDOWS or IS_LINUX:
             return True
 
+        now = time.monotonic()
+        if self._trust_cache is None or now - self._trust_ts >= 60:
+            self._trust_cache = self._check_certificate_trust_macos()
+            self._trust_ts = now
+        return self._trust_cache
+
+    def _check_certificate_trust_macos(self):
+        """Ask the macOS security framework whether the certificate is trusted"""
         try:
             cert_path = self.get_certificate_path()
             if not self.check_certificate_exists():
@@ -762,7 +1431,7 @@ class CertificateManager:
 
             # Method 2: Add with full trust settings
             print("Step 2: Adding certificate with full trust...")
-            user_keychain = os.path.expanduser("~/Library/Keychains/login.keychain-db")
+            user_keychain = str(MACOS_LOGIN_KEYCHAIN)
 
             # Import certificate
             cmd_import = ["security", "import", cert_path, "-k", user_keychain, "-A"]
@@ -780,6 +1449,7 @@ class CertificateManager:
 
                 if result_trust.returncode == 0:
                     print("✅ Certificate trust fixed successfully")
+                    self._trust_cache = None
                     return True
                 else:
                     print(f"❌ Trust setting failed: {result_trust.stderr}")
@@ -818,50 +1488,22 @@ class CertificateManager:
             elif IS_MACOS:
                 # macOS: Use security command with multiple strategies
 
-                # Strategy 1: Try to add to system keychain with trust settings
-                print("Attempting to install certificate to system keychain...")
-                cmd_system = [
-                    "security", "add-trusted-cert",
-                    "-d",  # Add to admin cert store
-                    "-r", "trustRoot",  # Set trust policy
-                    "-k", "/Library/Keychains/System.keychain",
-                    cert_path
-                ]
-                result_system = subprocess.run(cmd_system, capture_output=True, text=True)
+                # Nothing to do if an earlier run already got the certificate trusted
+                if self.verify_certificate_trust_macos():
+                    return True
+
+                # Strategies 1 and 2 target different keychains and don't depend on
+                # each other, so run them side by side; either one succeeding is enough
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    system_task = pool.submit(self._install_to_system_keychain_macos, cert_path)
+                    login_task = pool.submit(self._install_to_login_keychain_macos, cert_path)
+                    installed_system = system_task.result()
+                    installed_login = login_task.result()
 
-                if result_system.returncode == 0:
+                if installed_system or installed_login:
                     print(_('cert_installed_success'))
+                    self._trust_cache = None
                     return True
-                else:
-                    print(f"System keychain failed: {result_system.stderr}")
-
-                # Strategy 2: Add to login keychain with explicit trust
-                print("Attempting to install certificate to login keychain...")
-                user_keychain = os.path.expanduser("~/Library/Keychains/login.keychain-db")
-
-                # First add the certificate
-                cmd_add = ["security", "add-cert", "-k", user_keychain, cert_path]
-                result_add = subprocess.run(cmd_add, capture_output=True, text=True)
-
-                if result_add.returncode == 0:
-                    # Then set trust policy explicitly
-                    cmd_trust = [
-                        "security", "add-trusted-cert",
-                        "-d",  # Add to admin cert store
-                        "-r", "trustRoot",  # Trust for SSL
-                        "-k", user_keychain,
-                        cert_path
-                    ]
-                    result_trust = subprocess.run(cmd_trust, capture_output=True, text=True)
-
-                    if result_trust.returncode == 0:
-                        print(_('cert_installed_success'))
-                        print("✅ Certificate installed and trusted in login keychain")
-                        return True
-                    else:
-                        print(f"Trust setting failed: {result_trust.stderr}")
-                else:
-                    print(f"Certificate add failed: {result_add.stderr}")
 
                 # Strategy 3: Manual approach with user guidance
                 print("Automatic installation failed. Manual installation required.")
@@ -876,6 +1518,52 @@ class CertificateManager:
             print(_('cert_install_error').format(str(e)))
             return False
 
+    def _install_to_system_keychain_macos(self, cert_path):
+        """Strategy 1: add the certificate to the system keychain with trust settings"""
+        print("Attempting to install certificate to system keychain...")
+        cmd_system = [
+            "security", "add-trusted-cert",
+            "-d",  # Add to admin cert store
+            "-r", "trustRoot",  # Set trust policy
+            "-k", "/Library/Keychains/System.keychain",
+            cert_path
+        ]
+        result_system = subprocess.run(cmd_system, capture_output=True, text=True)
+
+        if result_system.returncode == 0:
+            return True
+        print(f"System keychain failed: {result_system.stderr}")
+        return False
+
+    def _install_to_login_keychain_macos(self, cert_path):
+        """Strategy 2: add the certificate to the login keychain with explicit trust"""
+        print("Attempting to install certificate to login keychain...")
+        user_keychain = str(MACOS_LOGIN_KEYCHAIN)
+
+        # First add the certificate
+        cmd_add = ["security", "add-cert", "-k", user_keychain, cert_path]
+        result_add = subprocess.run(cmd_add, capture_output=True, text=True)
+
+        if result_add.returncode != 0:
+            print(f"Certificate add failed: {result_add.stderr}")
+            return False
+
+        # Then set trust policy explicitly
+        cmd_trust = [
+            "security", "add-trusted-cert",
+            "-d",  # Add to admin cert store
+            "-r", "trustRoot",  # Trust for SSL
+            "-k", user_keychain,
+            cert_path
+        ]
+        result_trust = subprocess.run(cmd_trust, capture_output=True, text=True)
+
+        if result_trust.returncode == 0:
+            print("✅ Certificate installed and trusted in login keychain")
+            return True
+        print(f"Trust setting failed: {result_trust.stderr}")
+        return False
+
     def _show_manual_certificate_instructions(self, cert_path):
         """Show manual certificate installation instructions for macOS"""
         print("\n" + "="*60)
@@ -895,86 +1583,188 @@ class CertificateManager:
         print("\n" + "="*60)
 
 
-class MitmProxyManager:
+# Known mitmdump failure messages, one named group per kind of issue
+_MITMPROXY_ERROR_RE = re.compile(
+    r'(?P<perm>permission denied|operation not permitted)'
+    r'|(?P<port>address already in use|\bport\b)'
+    r'|(?P<mod>no module named|modulenotfounderror)'
+    r'|(?P<cmd>command not found|no such file)'
+    r'|(?P<cert>certificate|ssl|tls)'
+    r'|(?P<script>warp_proxy_script)',
+    re.IGNORECASE
+)
+
+# Suggestions per issue kind, in the order they take precedence
+_MITMPROXY_ERROR_HINTS = {
+    'perm': (
+        "🔒 Permission Issue:",
+        "   Try running with appropriate permissions",
+        "   Or change to a different port: proxy_manager.port = 8081",
+    ),
+    'port': (
+        "🚫 Port Conflict:",
+        "   Another process is using port 8080",
+        "   Kill existing process or use different port",
+        "   Check with: lsof -i :8080",
+    ),
+    'mod': (
+        "📦 Missing Dependencies:",
+        "   Install required packages:",
+        "   pip3 install mitmproxy",
+    ),
+    'cmd': (
+        "❌ Mitmproxy Not Found:",
+        "   Install mitmproxy:",
+        "   pip3 install mitmproxy",
+        "   Or: brew install mitmproxy",
+    ),
+    'cert': (
+        "🔒 Certificate Issue:",
+        "   Run certificate diagnosis:",
+        "   proxy_manager.diagnose_tls_issues()",
+    ),
+    'script': (
+        "📜 Script Issue:",
+        "   Check if warp_proxy_script.py exists",
+        "   Verify script has no syntax errors",
+    ),
+}
+
+_MITMPROXY_GENERAL_HINTS = (
+    "🔄 General Troubleshooting:",
+    "1. Check if mitmproxy is installed: mitmdump --version",
+    "2. Try running manually: mitmdump -p 8080",
+    "3. Check system requirements and dependencies",
+    "4. Verify warp_proxy_script.py exists and is valid",
+)
+
+
+class MitmProxyManager(QObject):
     """Manage mitmproxy process lifecycle and configuration"""
+    status = pyqtSignal(str, int)  # message, timeout in ms
 
     def __init__(self):
+        super().__init__()
         self.process = None
-        self.cmd_process_handle = None  # Track CMD window for cleanup
+        self.cmd_process_handle = None  # Track the debug console process for cleanup
         self.port = 8080  # Orijinal port
         self.script_path = "warp_proxy_script.py"  # Use the main proxy script
         self.debug_mode = True
         self.cert_manager = CertificateManager()
-
-    def start(self, parent_window=None):
-        """Start the mitmproxy process"""
+        # Set once check_mitmproxy_installation() has passed in this session
+        self._install_checked = False
+        # Full path of the mitmdump executable, resolved on first start
+        self._mitmdump_exe = None
+        # (reader thread, recent lines) for mitmdump stdout/stderr in debug mode
+        self._output_tails = None
+        # PID of a mitmdump found by scanning the process table
+        self._cached_mitm_pid = None
+        # Serializes certificate generation between the warm-up thread and start()
+        self._cert_lock = threading.Lock()
+        threading.Thread(target=self._warm_certificate, daemon=True).start()
+
+    def _warm_certificate(self):
+        """Check for (and if needed generate) the certificate before the first start()"""
         try:
-            if self.is_running():
-                print("Mitmproxy is already running")
-                return True
+            if self.cert_manager.check_certificate_exists():
+                return
+            # Without mitmdump there is nothing to bootstrap; start() reports that
+            if shutil.which("mitmdump") is None:
+                return
+            self._ensure_certificate()
+        except Exception as e:
+            print(f"Certificate warm-up error: {e}")
 
-            # First, check if mitmproxy is properly installed
-            print("🔍 Checking mitmproxy installation...")
-            if not self.check_mitmproxy_installation():
-                print("❌ Mitmproxy installation check failed")
-                return False
+    def _ensure_certificate(self):
+        """Generate the mitmproxy certificate if it is missing; returns True once it exists"""
+        with self._cert_lock:
+            if self.cert_manager.check_certificate_exists():
+                return True
 
-            # On first run ensure the certificate exists
-            if not self.cert_manager.check_certificate_exists():
-                print(_('cert_creating'))
+            print(_('cert_creating'))
 
-                # Run mitmproxy briefly to generate the certificate
-                temp_cmd = ["mitmdump", "--set", "confdir=~/.mitmproxy", "-q"]
-                try:
-                    if parent_window:
-                        parent_window.status_bar.showMessage(_('cert_creating'), 0)
+            # Run mitmproxy briefly to generate the certificate
+            temp_cmd = ["mitmdump", "--set", f"confdir={MITMPROXY_CONFDIR}", "-q"]
+            try:
+                popen_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
+                if IS_WINDOWS and hasattr(subprocess, "CREATE_NO_WINDOW"):
+                    popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+                temp_process = subprocess.Popen(temp_cmd, **popen_kwargs)
+
+                # Poll for the certificate (up to five seconds) and stop as soon as it appears
+                for _attempt in range(50):
+                    time.sleep(0.1)
+                    self.cert_manager.invalidate_cache()
+                    if self.cert_manager.check_certificate_exists():
+                        break
+                temp_process.terminate()
+                temp_process.wait(timeout=3)
+
+                print("✅ Certificate generation completed")
 
-                    popen_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
-                    if IS_WINDOWS and hasattr(subprocess, "CREATE_NO_WINDOW"):
-                        popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-                    temp_process = subprocess.Popen(temp_cmd, **popen_kwargs)
+            except Exception as e:
+                print(f"❌ Certificate generation error: {e}")
 
-                    # Wait five seconds and then stop the process
-                    time.sleep(5)
-                    temp_process.terminate()
-                    temp_process.wait(timeout=3)
+            # mitmdump may have just written the certificate
+            self.cert_manager.invalidate_cache()
 
-                    print("✅ Certificate generation completed")
+            # Verify that the certificate file was created
+            if not self.cert_manager.check_certificate_exists():
+                return False
+            print(_('cert_created_success'))
+            return True
 
-                except Exception as e:
-                    print(f"❌ Certificate generation error: {e}")
+    def start(self, parent_window=None):
+        """Start the mitmproxy process"""
+        try:
+            if self.is_running():
+                print("Mitmproxy is already running")
+                return True
 
-                # Verify that the certificate file was created
-                if not self.cert_manager.check_certificate_exists():
-                    if parent_window:
-                        parent_window.status_bar.showMessage(_('cert_creation_failed'), 5000)
+            # First, check if mitmproxy is properly installed (once per session)
+            if not self._install_checked:
+                print("🔍 Checking mitmproxy installation...")
+                if not self.check_mitmproxy_installation():
+                    print("❌ Mitmproxy installation check failed")
                     return False
-                else:
-                    print(_('cert_created_success'))
+                self._install_checked = True
+
+            # On first run ensure the certificate exists; this waits for the
+            # background warm-up instead of bootstrapping a second time
+            if not self.cert_manager.check_certificate_exists():
+                self.status.emit(_('cert_creating'), 0)
+            if not self._ensure_certificate():
+                self.status.emit(_('cert_creation_failed'), 5000)
+                return False
 
             # Sertifika otomatik kurulumu
             if parent_window and not parent_window.account_manager.is_certificate_approved():
-                print(_('cert_installing'))
-
-                # Attempt to install the certificate automatically
-                if self.cert_manager.install_certificate_automatically():
-                    # Record approval if installation succeeded
+                if IS_MACOS and self.cert_manager.verify_certificate_trust_macos():
+                    # Already trusted by an earlier install; just record the approval
                     parent_window.account_manager.set_certificate_approved(True)
-                    parent_window.status_bar.showMessage(_('cert_installed_success'), 3000)
-
-                    # On macOS additionally validate certificate trust
-                    if IS_MACOS:
-                        if not self.cert_manager.verify_certificate_trust_macos():
-                            print("⚠️ Certificate may not be fully trusted. Manual verification recommended.")
-                            parent_window.status_bar.showMessage("Certificate installed but may need manual trust setup", 5000)
                 else:
-                    # If automatic install fails show the manual install dialog
-                    dialog_result = self.show_manual_certificate_dialog(parent_window)
-                    if dialog_result:
-                        # User confirmed that installation finished
+                    print(_('cert_installing'))
+
+                    # Attempt to install the certificate automatically
+                    if self.cert_manager.install_certificate_automatically():
+                        self.cert_manager.invalidate_cache()
+                        # Record approval if installation succeeded
                         parent_window.account_manager.set_certificate_approved(True)
+                        self.status.emit(_('cert_installed_success'), 3000)
+
+                        # On macOS additionally validate certificate trust
+                        if IS_MACOS:
+                            if not self.cert_manager.verify_certificate_trust_macos():
+                                print("⚠️ Certificate may not be fully trusted. Manual verification recommended.")
+                                self.status.emit("Certificate installed but may need manual trust setup", 5000)
                     else:
-                        return False
+                        # If automatic install fails show the manual install dialog
+                        dialog_result = self.show_manual_certificate_dialog(parent_window)
+                        if dialog_result:
+                            # User confirmed that installation finished
+                            parent_window.account_manager.set_certificate_approved(True)
+                        else:
+                            return False
 
 
             # Build the mitmproxy command
@@ -983,7 +1773,7 @@ class MitmProxyManager:
                 "--listen-host", "127.0.0.1",  # IPv4'te dinle
                 "-p", str(self.port),
                 "-s", self.script_path,
-                "--set", "confdir=~/.mitmproxy",
+                "--set", f"confdir={MITMPROXY_CONFDIR}",
                 "--set", "keep_host_header=true",    # Preserve the original host header
             ]
 
@@ -991,33 +1781,40 @@ class MitmProxyManager:
 
             # Start process - platform-specific console handling
             if IS_WINDOWS:
-                cmd_str = ' '.join(f'"{arg}"' if ' ' in arg else arg for arg in cmd)
+                # Launch mitmdump directly from an argv list; no cmd.exe in between
+                if self._mitmdump_exe is None:
+                    self._mitmdump_exe = shutil.which("mitmdump") or "mitmdump"
+                argv = [self._mitmdump_exe] + cmd[1:]
 
                 if self.debug_mode:
-                    # Debug mode: Console window visible
+                    # Debug mode: mitmdump gets its own visible console window
                     print("Debug mode active - Mitmproxy console window will open")
                     self.cmd_process_handle = subprocess.Popen(
-                        f'cmd /k "{cmd_str}"',
-                        shell=True,
-                        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+                        argv,
+                        creationflags=subprocess.CREATE_NEW_CONSOLE
                     )
                 else:
                     # Normal mode: Hidden console window
                     print("Normal mode - Mitmproxy will run in background")
                     self.process = subprocess.Popen(
-                        cmd_str,
-                        shell=True,
+                        argv,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         creationflags=subprocess.CREATE_NO_WINDOW
                     )
+                self._write_pid_file((self.cmd_process_handle if self.debug_mode else self.process).pid)
 
-                # Windows start command returns immediately, so check port
+                # Popen returns immediately, so poll the port with a short, growing
+                # interval (50 ms up to 500 ms) for at most 10 seconds
                 print("Starting Mitmproxy, checking port...")
-                for i in range(10):  # Wait 10 seconds
-                    time.sleep(1)
-                    if self.is_port_open("127.0.0.1", self.port):
+                deadline = time.monotonic() + 10
+                wait = 0.05
+                while time.monotonic() < deadline:
+                    if self.is_port_open("127.0.0.1", self.port, timeout=0.1):
                         print(f"Mitmproxy started successfully - Port {self.port} is open")
                         return True
-                    print(f"Checking port... ({i+1}/10)")
+                    time.sleep(wait)
+                    wait = min(wait * 1.5, 0.5)
 
                 print("Failed to start Mitmproxy - port did not open")
                 return False
@@ -1026,12 +1823,15 @@ class MitmProxyManager:
                 if self.debug_mode:
                     print("Debug mode active - Mitmproxy will run in foreground")
                     print("🔍 TLS issues? Run diagnosis with: proxy_manager.diagnose_tls_issues()")
-                    # On macOS/Linux, run in foreground for debug mode
+                    # Capture output for diagnosis; background threads keep the pipes drained
                     self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                    self._start_output_drain()
                 else:
                     print("Normal mode - Mitmproxy will run in background")
-                    # Run in background but capture errors for diagnosis
-                    self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                    # Nobody reads the output in the background, so don't let it fill a pipe
+                    self.process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    self._output_tails = None
+                self._write_pid_file(self.process.pid)
 
                 # Wait a bit and check if process is still running
                 time.sleep(2)
@@ -1048,74 +1848,66 @@ class MitmProxyManager:
                     return True
                 else:
                     # Process terminated, get error output
-                    try:
-                        stdout, stderr = self.process.communicate(timeout=5)
-                        print(f"\n❌ Failed to start Mitmproxy - Process terminated")
-                        print(f"\n📝 Error Details:")
-                        if stderr:
-                            print(f"STDERR: {stderr.strip()}")
-                        if stdout:
-                            print(f"STDOUT: {stdout.strip()}")
-
-                        # Common solutions based on error patterns
-                        self._suggest_mitmproxy_solutions(stderr, stdout)
-                    except subprocess.TimeoutExpired:
-                        print("❌ Process communication timeout")
+                    stdout, stderr = self._collect_output(timeout=5)
+                    print(f"\n❌ Failed to start Mitmproxy - Process terminated")
+                    print(f"\n📝 Error Details:")
+                    if stderr:
+                        print(f"STDERR: {stderr.strip()}")
+                    if stdout:
+                        print(f"STDOUT: {stdout.strip()}")
+
+                    # Common solutions based on error patterns
+                    self._suggest_mitmproxy_solutions(stderr, stdout)
                     return False
 
         except Exception as e:
             print(f"Mitmproxy startup error: {e}")
             return False
 
+    def _start_output_drain(self):
+        """Read mitmdump's stdout/stderr into bounded buffers so the child never blocks on a full pipe"""
+        self._output_tails = []
+        for stream in (self.process.stdout, self.process.stderr):
+            tail = deque(maxlen=4096)
+            thread = threading.Thread(target=self._drain_stream, args=(stream, tail), daemon=True)
+            thread.start()
+            self._output_tails.append((thread, tail))
+
+    @staticmethod
+    def _drain_stream(stream, tail):
+        """Keep the most recent output lines of a child process stream"""
+        for line in stream:
+            tail.append(line)
+        stream.close()
+
+    def _collect_output(self, timeout):
+        """Return (stdout, stderr) captured from mitmdump, waiting briefly for the readers"""
+        if not self._output_tails:
+            return '', ''
+        collected = []
+        for thread, tail in self._output_tails:
+            thread.join(timeout)
+            collected.append(''.join(tail))
+        return collected[0], collected[1]
+
     def _suggest_mitmproxy_solutions(self, stderr, stdout):
         """Suggest solutions based on mitmproxy error output"""
         print("\n🛠️ Possible Solutions:")
 
         error_text = (stderr or '') + (stdout or '')
-        error_lower = error_text.lower()
-
-        # Check for common issues
-        if 'permission denied' in error_lower or 'operation not permitted' in error_lower:
-            print("🔒 Permission Issue:")
-            print("   Try running with appropriate permissions")
-            print("   Or change to a different port: proxy_manager.port = 8081")
-
-        elif 'address already in use' in error_lower or 'port' in error_lower:
-            print("🚫 Port Conflict:")
-            print("   Another process is using port 8080")
-            print("   Kill existing process or use different port")
-            print(f"   Check with: lsof -i :8080")
-
-        elif 'no module named' in error_lower or 'modulenotfounderror' in error_lower:
-            print("📦 Missing Dependencies:")
-            print("   Install required packages:")
-            print("   pip3 install mitmproxy")
-
-        elif 'command not found' in error_lower or 'no such file' in error_lower:
-            print("❌ Mitmproxy Not Found:")
-            print("   Install mitmproxy:")
-            print("   pip3 install mitmproxy")
-            print("   Or: brew install mitmproxy")
 
-        elif 'certificate' in error_lower or 'ssl' in error_lower or 'tls' in error_lower:
-            print("🔒 Certificate Issue:")
-            print("   Run certificate diagnosis:")
-            print("   proxy_manager.diagnose_tls_issues()")
-
-        elif 'script' in error_lower and 'warp_proxy_script' in error_lower:
-            print("📜 Script Issue:")
-            print("   Check if warp_proxy_script.py exists")
-            print("   Verify script has no syntax errors")
-
-        else:
-            print("🔄 General Troubleshooting:")
-            print("1. Check if mitmproxy is installed: mitmdump --version")
-            print("2. Try running manually: mitmdump -p 8080")
-            print("3. Check system requirements and dependencies")
-            print("4. Verify warp_proxy_script.py exists and is valid")
+        # One scan collects every kind of issue; the first in hint order wins
+        found = {match.lastgroup for match in _MITMPROXY_ERROR_RE.finditer(error_text)}
+        kind = next((kind for kind in _MITMPROXY_ERROR_HINTS if kind in found), None)
+        for line in _MITMPROXY_ERROR_HINTS.get(kind, _MITMPROXY_GENERAL_HINTS):
+            print(line)
 
         print("\n📞 For more help, check mitmproxy documentation")
 
+    def refresh_installation_check(self):
+        """Re-run the installation check on the next start(), e.g. after reinstalling mitmproxy"""
+        self._install_checked = False
+
     def check_mitmproxy_installation(self):
         """Check if mitmproxy is properly installed"""
         print("\n🔍 MITMPROXY INSTALLATION CHECK")
@@ -1177,25 +1969,52 @@ class MitmProxyManager:
             if self.process and self.process.poll() is None:
                 self.process.terminate()
                 self.process.wait(timeout=10)
+                self._remove_pid_file()
                 print("Mitmproxy durduruldu")
                 return True
 
-            # If no process reference is stored, find by PID and terminate
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            # If no process reference is stored, use the pidfile / cached PID
+            proc = self._known_mitmdump_process()
+            if proc is None and not IS_WINDOWS and shutil.which("pkill"):
+                # Let pkill match the command line instead of scanning every process here;
+                # it exits with 1 when nothing matched, then fall back to the psutil scan
+                if self._pkill_mitmdump("-TERM") == 0:
+                    deadline = time.monotonic() + 10
+                    while self._pkill_mitmdump("-0") == 0 and time.monotonic() < deadline:
+                        time.sleep(0.2)
+                    if self._pkill_mitmdump("-0") == 0:
+                        self._pkill_mitmdump("-KILL")
+                    self._remove_pid_file()
+                    print("Mitmproxy durduruldu")
+                    return True
+            if proc is None:
+                proc = self._find_mitmdump_process()
+
+            if proc is not None:
                 try:
-                    if 'mitmdump' in proc.info['name'] and str(self.port) in ' '.join(proc.info['cmdline']):
-                        proc.terminate()
-                        proc.wait(timeout=10)
-                        print(f"Mitmproxy durduruldu (PID: {proc.info['pid']})")
-                        return True
-                except:
-                    continue
+                    proc.terminate()
+                    proc.wait(timeout=10)
+                    print(f"Mitmproxy durduruldu (PID: {proc.pid})")
+                except psutil.TimeoutExpired:
+                    proc.kill()
+                except Exception:
+                    pass
+                self._cached_mitm_pid = None
+            self._remove_pid_file()
 
             return True
         except Exception as e:
             print(f"Mitmproxy shutdown error: {e}")
             return False
 
+    def _pkill_mitmdump(self, signal_flag):
+        """Send a signal (e.g. "-TERM"; "-0" only probes) to mitmdump on our port; returns pkill's exit code"""
+        return subprocess.run(
+            ["pkill", signal_flag, "-f", f"mitmdump .*-p {self.port}( |$)"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        ).returncode
+
     def is_running(self):
         """Return True if the mitmproxy process is running"""
         try:
@@ -1203,16 +2022,64 @@ class MitmProxyManager:
                 return True
 
             # PID ile kontrol et
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if 'mitmdump' in proc.info['name'] and str(self.port) in ' '.join(proc.info['cmdline']):
-                        return True
-                except:
-                    continue
-            return False
-        except:
+            return self._find_mitmdump_process() is not None
+        except (psutil.Error, OSError):
             return False
 
+    def _write_pid_file(self, pid):
+        """Remember the PID of the mitmdump we started"""
+        self._cached_mitm_pid = pid
+        try:
+            MITMPROXY_PID_FILE.write_text(str(pid))
+        except OSError as e:
+            print(f"PID file write warning: {e}")
+
+    def _remove_pid_file(self):
+        """Forget the PID of a stopped mitmdump"""
+        try:
+            MITMPROXY_PID_FILE.unlink()
+        except OSError:
+            pass
+
+    def _known_mitmdump_process(self):
+        """Return the mitmdump process named by the cached PID or the pidfile, without scanning"""
+        pid = self._cached_mitm_pid
+        if pid is None:
+            try:
+                pid = int(MITMPROXY_PID_FILE.read_text())
+            except (OSError, ValueError):
+                return None
+        if psutil.pid_exists(pid):
+            try:
+                proc = psutil.Process(pid)
+                # Guard against the PID having been reused by another program
+                if 'mitmdump' in (proc.name() or ''):
+                    self._cached_mitm_pid = pid
+                    return proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        self._cached_mitm_pid = None
+        return None
+
+    def _find_mitmdump_process(self):
+        """Return the psutil process of a mitmdump listening on our port, or None"""
+        proc = self._known_mitmdump_process()
+        if proc is not None:
+            return proc
+
+        port = str(self.port)
+        # Filter on the cheap name first; cmdline costs an extra read per process
+        for proc in psutil.process_iter(['pid', 'name']):
+            if 'mitmdump' not in (proc.info['name'] or ''):
+                continue
+            try:
+                if any(port in arg for arg in proc.cmdline()):
+                    self._cached_mitm_pid = proc.info['pid']
+                    return proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return None
+
     def get_proxy_url(self):
         """Return the local proxy URL"""
         return f"127.0.0.1:{self.port}"
@@ -1255,16 +2122,12 @@ class MitmProxyManager:
 
         return True
 
-    def is_port_open(self, host, port):
+    def is_port_open(self, host, port, timeout=1):
         """Check whether the given host/port is reachable"""
-        import socket
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            return result == 0
-        except:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
             return False
 
     def show_manual_certificate_dialog(self, parent_window):
@@ -1277,6 +2140,53 @@ class MitmProxyManager:
             return False
 
 
+# Button styles of the manual certificate dialog, shared by every instance
+_CERT_OPEN_FOLDER_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+
+_CERT_COMPLETED_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+"""
+
+_CERT_CANCEL_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #d32f2f;
+    }
+"""
+
+
 class ManualCertificateDialog(QDialog):
     """Dialog guiding the user through manual certificate installation"""
 
@@ -1286,7 +2196,14 @@ class ManualCertificateDialog(QDialog):
         self.setWindowTitle(_('cert_manual_title'))
         self.setGeometry(300, 300, 650, 550)
         self.setModal(True)
-        self.init_ui()
+        # Widgets are built on first show, not for dialogs that never appear
+        self._ui_built = False
+
+    def showEvent(self, event):
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+        super().showEvent(event)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -1334,56 +2251,17 @@ class ManualCertificateDialog(QDialog):
 
         # Button to open the certificate folder directly
         self.open_folder_button = QPushButton(_('cert_open_folder'))
-        self.open_folder_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.open_folder_button.setStyleSheet(_CERT_OPEN_FOLDER_BUTTON_STYLE)
         self.open_folder_button.clicked.connect(self.open_certificate_folder)
 
         # Button confirming certificate install completion
         self.completed_button = QPushButton(_('cert_manual_complete'))
-        self.completed_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.completed_button.setStyleSheet(_CERT_COMPLETED_BUTTON_STYLE)
         self.completed_button.clicked.connect(self.accept)
 
         # Cancel button
         cancel_button = QPushButton(_('cancel'))
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
+        cancel_button.setStyleSheet(_CERT_CANCEL_BUTTON_STYLE)
         cancel_button.clicked.connect(self.reject)
 
         button_layout.addWidget(self.open_folder_button)
@@ -1412,17 +2290,77 @@ class ManualCertificateDialog(QDialog):
             QMessageBox.warning(self, _('error'), _('file_open_error').format(str(e)))
 
 
+def request_token_renewal(email, account_data, session=_DIRECT_HTTP_SESSION, verify=True):
+    """Ask Firebase for a new token; returns the new stsTokenManager fields or None"""
+    try:
+        token_manager = account_data['stsTokenManager']
+        refresh_token = token_manager['refreshToken']
+        api_key = account_data.get('apiKey')
+
+        if not api_key:
+            raise ValueError("Firebase API key was not found")
+
+        # Bypass proxy to call Firebase directly
+        response = session.post(_token_refresh_url(api_key), data=_token_refresh_body(refresh_token),
+                                headers=_TOKEN_REFRESH_HEADERS, timeout=30, verify=verify)
+
+        if response.status_code == 200:
+            token_data = _json_loads(response.content)
+
+            # Results cached for the replaced token are no longer useful
+            invalidate_limit_info(token_manager.get('accessToken', ''))
+
+            return {
+                'accessToken': token_data['access_token'],
+                'refreshToken': token_data.get('refresh_token', refresh_token),
+                'expirationTime': int(time.time() * 1000) + int(token_data['expires_in']) * 1000
+            }
+        else:
+            print(f"Token refresh error: {response.status_code} - {response.text}")
+            return None
+
+    except Exception as e:
+        print(f"Token refresh error ({email}): {e}")
+        return None
+
+
+def request_limit_info(account_data, session=_DIRECT_HTTP_SESSION, verify=True):
+    """Fetch GetRequestLimitInfo for an account, reusing a recent result for the same token"""
+    try:
+        access_token = account_data['stsTokenManager']['accessToken']
+        cached = get_cached_limit_info(access_token)
+        if cached is not None:
+            return cached
+
+        url = "https://app.warp.dev/graphql/v2?op=GetRequestLimitInfo"
+        base_headers, body = _limit_info_request()
+        headers = {**base_headers, 'Authorization': f'Bearer {access_token}'}
+
+        # Connect without using the proxy
+        response = session.post(url, headers=headers, data=body, timeout=30, verify=verify)
+
+        if response.status_code == 200:
+            limit_info = _extract_limit_info(_json_loads(response.content))
+            if limit_info is not None:
+                store_limit_info(access_token, limit_info)
+            return limit_info
+        return None
+    except Exception as e:
+        print(f"Limit information retrieval error: {e}")
+        return None
+
+
 class TokenWorker(QThread):
     """Refresh a single account token in the background"""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)  # success, message
     error = pyqtSignal(str)
 
-    def __init__(self, email, account_data, proxy_enabled=False):
+    def __init__(self, email, account_data, proxy_enabled=False, account_manager=None):
         super().__init__()
         self.email = email
         self.account_data = account_data
-        self.account_manager = AccountManager()
+        self.account_manager = account_manager or get_default_account_manager()
         self.proxy_enabled = proxy_enabled
 
     def run(self):
@@ -1430,49 +2368,25 @@ class TokenWorker(QThread):
             self.progress.emit(f"Refreshing token for {self.email}")
 
             if self.refresh_token():
-                self.account_manager.update_account_health(self.email, 'healthy')
+                self.account_manager.update_account_health(self.email, HealthStatus.HEALTHY)
                 self.finished.emit(True, f"Token refreshed successfully for {self.email}")
             else:
-                self.account_manager.update_account_health(self.email, 'unhealthy')
+                self.account_manager.update_account_health(self.email, HealthStatus.UNHEALTHY)
                 self.finished.emit(False, f"Token refresh failed for {self.email}")
 
         except Exception as e:
             self.error.emit(f"Token refresh error: {str(e)}")
 
     def refresh_token(self):
-        """Refresh the Firebase token for this account"""
-        try:
-            refresh_token = self.account_data['stsTokenManager']['refreshToken']
-            api_key = self.account_data['apiKey']
-
-            url = f"https://securetoken.googleapis.com/v1/token?key={api_key}"
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'WarpAccountManager/1.0'
-            }
-            data = {
-                'grant_type': 'refresh_token',
-                'refresh_token': refresh_token
-            }
-
-            # Connect without using a proxy
-            proxies = {'http': None, 'https': None} if self.proxy_enabled else None
-            response = requests.post(url, json=data, headers=headers, timeout=30,
-                                   verify=not self.proxy_enabled, proxies=proxies)
-
-            if response.status_code == 200:
-                token_data = response.json()
-                new_token_data = {
-                    'accessToken': token_data['access_token'],
-                    'refreshToken': token_data['refresh_token'],
-                    'expirationTime': int(time.time() * 1000) + (int(token_data['expires_in']) * 1000)
-                }
-
-                return self.account_manager.update_account_token(self.email, new_token_data)
-            return False
-        except Exception as e:
-            print(f"Token refresh error: {e}")
+        """Refresh the Firebase token for this account and store it"""
+        session = _DIRECT_HTTP_SESSION if self.proxy_enabled else _HTTP_SESSION
+        # Share the request with an auto-renewal already refreshing this account
+        new_token_data = _coalesced_refresh(self.email, request_token_renewal,
+                                            self.email, self.account_data, session, not self.proxy_enabled,
+                                            force=True)
+        if not new_token_data:
             return False
+        return self.account_manager.update_account_token(self.email, new_token_data)
 
 
 class TokenRefreshWorker(QThread):
@@ -1481,215 +2395,211 @@ class TokenRefreshWorker(QThread):
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
-    def __init__(self, accounts, proxy_enabled=False):
+    # Accounts are independent, so their HTTP round trips run concurrently
+    MAX_PARALLEL_REQUESTS = 16
+    # Minimum seconds between progress signals, so bulk runs don't flood the GUI queue
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, accounts, proxy_enabled=False, account_manager=None, bypass_backoff=False):
         super().__init__()
         self.accounts = accounts
-        self.account_manager = AccountManager()
+        # Manual refreshes retry accounts whose last refresh failed moments ago
+        self.bypass_backoff = bypass_backoff
+        self.account_manager = account_manager or get_default_account_manager()
         self.proxy_enabled = proxy_enabled
+        # Process-wide keep-alive session; its pool covers MAX_PARALLEL_REQUESTS
+        self.session = _DIRECT_HTTP_SESSION if proxy_enabled else _HTTP_SESSION
+        self._last_progress_emit = float('-inf')
 
     def run(self):
-        results = []
+        results = [None] * len(self.accounts)
+        # Token, health and limit changes are collected and written in one transaction at the end
+        updates = []
         total_accounts = len(self.accounts)
 
-        for i, (email, account_json, health_status) in enumerate(self.accounts):
-            try:
-                self.progress.emit(int((i / total_accounts) * 100), _('processing_account', email))
+        if total_accounts:
+            max_workers = min(self.MAX_PARALLEL_REQUESTS, total_accounts)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(self._process_account, email, account_json, health_status): index
+                    for index, (email, account_json, health_status) in enumerate(self.accounts)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    result, health, limit, token_data = future.result()
+                    results[index] = result
+                    email = result[0]
+                    updates.append((email, health, limit, token_data))
+                    self._emit_progress(int((done / total_accounts) * 100), _('processing_account', email),
+                                        force=done == total_accounts)
+
+        self.account_manager.bulk_update(updates)
+        self.finished.emit(results)
 
-                # Skip banned accounts
-                if health_status == _('status_banned_key'):
-                    self.account_manager.update_account_limit_info(email, _('status_na'))
-                    results.append((email, _('status_banned'), _('status_na')))
-                    continue
+    def _emit_progress(self, value, text, force=False):
+        """Emit a progress update unless one went out less than PROGRESS_INTERVAL ago"""
+        now = time.monotonic()
+        if force or now - self._last_progress_emit >= self.PROGRESS_INTERVAL:
+            self._last_progress_emit = now
+            self.progress.emit(value, text)
 
-                account_data = json.loads(account_json)
+    def _process_account(self, email, account_json, health_status):
+        """Refresh one account; returns (result row, new health or None, limit text, new token data or None)"""
+        new_token_data = None
+        try:
+            # Skip banned accounts
+            if health_status == HealthStatus.BANNED:
+                return (email, _i(TextKey.status_banned), _i(TextKey.status_na)), None, _i(TextKey.status_na), None
 
-                # Check token expiration
-                expiration_time = account_data['stsTokenManager']['expirationTime']
-                current_time = int(time.time() * 1000)
+            account_data = self.account_manager.get_account_dict(email, account_json)
 
-                if current_time >= expiration_time:
-                    # Token expired, attempt a refresh
-                    self.progress.emit(int((i / total_accounts) * 100), _('refreshing_token', email))
-                    if not self.refresh_token(email, account_data):
-                        # Token refresh failed; mark account unhealthy
-                        self.account_manager.update_account_health(email, _('status_unhealthy'))
-                        self.account_manager.update_account_limit_info(email, _('status_na'))
-                        results.append((email, _('token_refresh_failed', email), _('status_na')))
-                        continue
+            # Check token expiration
+            expiration_time = account_data['stsTokenManager']['expirationTime']
+            current_time = int(time.time() * 1000)
 
-                    # Pull updated account data from the database
-                    updated_accounts = self.account_manager.get_accounts()
-                    for updated_email, updated_json in updated_accounts:
-                        if updated_email == email:
-                            account_data = json.loads(updated_json)
-                            break
+            if token_needs_refresh(expiration_time, current_time):
+                # Token expired or about to, attempt a refresh
+                self._emit_progress(-1, _('refreshing_token', email))
+                new_token_data = _coalesced_refresh(email, self.refresh_token, email, account_data,
+                                                    force=self.bypass_backoff)
+                if new_token_data is REFRESH_SKIPPED:
+                    # Failed moments ago; report and keep the stored health and limit until the backoff ends
+                    summary = self.account_manager.get_account_summary(email)
+                    stored_limit = summary[3] if summary and summary[3] else _i(TextKey.status_not_updated)
+                    return (email, _('token_refresh_skipped', email), stored_limit), None, None, None
+                if not new_token_data:
+                    # Token refresh failed; mark account unhealthy
+                    return ((email, _('token_refresh_failed', email), _i(TextKey.status_na)),
+                            HealthStatus.UNHEALTHY, _i(TextKey.status_na), None)
+
+                # Use the new token right away; it is stored with the batch at the end
+                account_data = dict(account_data)
+                account_data['stsTokenManager'] = {**account_data['stsTokenManager'], **new_token_data}
+
+            # Fetch limit information
+            limit_info = self.get_limit_info(account_data)
+            if limit_info:
+                used = limit_info.get('requestsUsedSinceLastRefresh', 0)
+                total = limit_info.get('requestLimit', 0)
+                limit_text = f"{used}/{total}"
+                # Successful update: mark healthy and store limit data
+                return (email, _('success'), limit_text), HealthStatus.HEALTHY, limit_text, new_token_data
+
+            # Limit information unavailable; mark unhealthy
+            return ((email, _('limit_info_failed'), _i(TextKey.status_na)),
+                    HealthStatus.UNHEALTHY, _i(TextKey.status_na), new_token_data)
 
-                # Fetch limit information
-                limit_info = self.get_limit_info(account_data)
-                if limit_info:
-                    used = limit_info.get('requestsUsedSinceLastRefresh', 0)
-                    total = limit_info.get('requestLimit', 0)
-                    limit_text = f"{used}/{total}"
-                    # Successful update: mark healthy and store limit data
-                    self.account_manager.update_account_health(email, _('status_healthy'))
-                    self.account_manager.update_account_limit_info(email, limit_text)
-                    results.append((email, _('success'), limit_text))
-                else:
-                    # Limit information unavailable; mark unhealthy
-                    self.account_manager.update_account_health(email, _('status_unhealthy'))
-                    self.account_manager.update_account_limit_info(email, _('status_na'))
-                    results.append((email, _('limit_info_failed'), _('status_na')))
+        except Exception as e:
+            return (email, f"{_('error')}: {str(e)}", _i(TextKey.status_na)), None, _i(TextKey.status_na), new_token_data
 
-            except Exception as e:
-                self.account_manager.update_account_limit_info(email, _('status_na'))
-                results.append((email, f"{_('error')}: {str(e)}", _('status_na')))
+    def refresh_token(self, email, account_data):
+        """Refresh the Firebase token; returns the new token fields or None"""
+        return request_token_renewal(email, account_data, self.session, not self.proxy_enabled)
 
-        self.finished.emit(results)
+    def get_limit_info(self, account_data):
+        """Warp API'den limit bilgilerini getir"""
+        return request_limit_info(account_data, self.session, not self.proxy_enabled)
 
-    def refresh_token(self, email, account_data):
-        """Refresh the Firebase token for the given account"""
-        try:
-            refresh_token = account_data['stsTokenManager']['refreshToken']
-            api_key = account_data['apiKey']
 
-            url = f"https://securetoken.googleapis.com/v1/token?key={api_key}"
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'WarpAccountManager/1.0'  # Identify requests originating from the manager
-            }
-            data = {
-                'grant_type': 'refresh_token',
-                'refresh_token': refresh_token
-            }
+class TokenRenewalWorker(QThread):
+    """Renew expiring tokens in the background and store them in one transaction"""
+    finished = pyqtSignal(int, int)  # renewed count, attempted count (excludes backed-off accounts)
 
-            # Connect without using a proxy when not required
-            proxies = {'http': None, 'https': None} if self.proxy_enabled else None
-            response = requests.post(url, json=data, headers=headers, timeout=30,
-                                   verify=not self.proxy_enabled, proxies=proxies)
+    MAX_PARALLEL_REQUESTS = 8
 
-            if response.status_code == 200:
-                token_data = response.json()
-                new_token_data = {
-                    'accessToken': token_data['access_token'],
-                    'refreshToken': token_data['refresh_token'],
-                    'expirationTime': int(time.time() * 1000) + (int(token_data['expires_in']) * 1000)
-                }
+    def __init__(self, emails, account_manager=None):
+        super().__init__()
+        self.emails = emails
+        self.account_manager = account_manager or get_default_account_manager()
 
-                return self.account_manager.update_account_token(email, new_token_data)
-            return False
-        except Exception as e:
-            print(f"Token refresh error: {e}")
-            return False
+    def run(self):
+        # Each renewal is an independent HTTPS round trip, so run them concurrently
+        updates = []
+        skipped = 0
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_REQUESTS, len(self.emails))) as pool:
+            futures = {pool.submit(self._renew, email): email for email in self.emails}
+            for future in as_completed(futures):
+                email = futures[future]
+                new_token_data = future.result()
+                if new_token_data is REFRESH_SKIPPED:
+                    skipped += 1
+                elif new_token_data:
+                    updates.append((email, None, None, new_token_data))
+                    print(f"✅ Token yenilendi: {email}")
+                else:
+                    print(f"❌ Token yenilenemedi: {email}")
 
-    def get_limit_info(self, account_data):
-        """Warp API'den limit bilgilerini getir"""
+        renewed_count = len(updates) if updates and self.account_manager.bulk_update(updates) else 0
+        self.finished.emit(renewed_count, len(self.emails) - skipped)
+
+    def _renew(self, email):
+        """Load an account and request a new token"""
         try:
-            access_token = account_data['stsTokenManager']['accessToken']
+            account_data = self.account_manager.get_account_dict(email)
+            return _coalesced_refresh(email, request_token_renewal, email, account_data)
+        except Exception as e:
+            print(f"Token check error ({email}): {e}")
+            return None
 
-            # Get dynamic OS information
-            os_info = get_os_info()
 
-            url = "https://app.warp.dev/graphql/v2?op=GetRequestLimitInfo"
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {access_token}',
-                'X-Warp-Client-Version': 'v0.2025.08.27.08.11.stable_04',
-                'X-Warp-Os-Category': os_info['category'],
-                'X-Warp-Os-Name': os_info['name'],
-                'X-Warp-Os-Version': os_info['version'],
-                'Accept': '*/*',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'X-Warp-Manager-Request': 'true'  # Identify request as originating from our application
-            }
+# Browser-console snippet that exposes Warp's Firebase session as copyable JSON
+_INDEXEDDB_EXTRACTOR_JS = """(async () => {
+  const request = indexedDB.open("firebaseLocalStorageDb");
 
-            query = """
-            query GetRequestLimitInfo($requestContext: RequestContext!) {
-              user(requestContext: $requestContext) {
-                __typename
-                ... on UserOutput {
-                  user {
-                    requestLimitInfo {
-                      isUnlimited
-                      nextRefreshTime
-                      requestLimit
-                      requestsUsedSinceLastRefresh
-                      requestLimitRefreshDuration
-                      isUnlimitedAutosuggestions
-                      acceptedAutosuggestionsLimit
-                      acceptedAutosuggestionsSinceLastRefresh
-                      isUnlimitedVoice
-                      voiceRequestLimit
-                      voiceRequestsUsedSinceLastRefresh
-                      voiceTokenLimit
-                      voiceTokensUsedSinceLastRefresh
-                      isUnlimitedCodebaseIndices
-                      maxCodebaseIndices
-                      maxFilesPerRepo
-                      embeddingGenerationBatchSize
-                    }
-                  }
-                }
-                ... on UserFacingError {
-                  error {
-                    __typename
-                    ... on SharedObjectsLimitExceeded {
-                      limit
-                      objectType
-                      message
-                    }
-                    ... on PersonalObjectsLimitExceeded {
-                      limit
-                      objectType
-                      message
-                    }
-                    ... on AccountDelinquencyError {
-                      message
-                    }
-                    ... on GenericStringObjectUniqueKeyConflict {
-                      message
-                    }
-                  }
-                  responseContext {
-                    serverVersion
-                  }
-                }
-              }
-            }
-            """
+  request.onsuccess = function (event) {
+    const db = event.target.result;
+    const tx = db.transaction("firebaseLocalStorage", "readonly");
+    const store = tx.objectStore("firebaseLocalStorage");
 
-            payload = {
-                "query": query,
-                "variables": {
-                    "requestContext": {
-                        "clientContext": {
-                            "version": "v0.2025.08.27.08.11.stable_04"
-                        },
-                        "osContext": {
-                            "category": os_info['category'],
-                            "linuxKernelVersion": None,
-                            "name": os_info['category'],
-                            "version": os_info['version']
-                        }
-                    }
-                },
-                "operationName": "GetRequestLimitInfo"
-            }
+    const getAllReq = store.getAll();
+
+    getAllReq.onsuccess = function () {
+      const results = getAllReq.result;
+
+      // get the first record's value
+      const firstValue = results[0]?.value;
+      console.log("Value (object):", firstValue);
+
+      // convert to JSON string
+      const valueString = JSON.stringify(firstValue, null, 2);
 
-            # Connect without using a proxy
-            proxies = {'http': None, 'https': None} if self.proxy_enabled else None
-            response = requests.post(url, headers=headers, json=payload, timeout=30,
-                                   verify=not self.proxy_enabled, proxies=proxies)
+      // add a button to copy the value
+      const btn = document.createElement("button");
+      btn.innerText = "-> Copy JSON <--";
+      btn.style.position = "fixed";
+      btn.style.top = "20px";
+      btn.style.right = "20px";
+      btn.style.zIndex = 9999;
+      btn.onclick = () => {
+        navigator.clipboard.writeText(valueString).then(() => {
+          alert("Copied!");
+        });
+      };
+      document.body.appendChild(btn);
+    };
+  };
+})();"""
 
-            if response.status_code == 200:
-                data = response.json()
-                if 'data' in data and 'user' in data['data']:
-                    user_data = data['data']['user']
-                    if user_data.get('__typename') == 'UserOutput':
-                        return user_data['user']['requestLimitInfo']
-            return None
-        except Exception as e:
-            print(f"Limit information retrieval error: {e}")
-            return None
+# Style sheets of the add-account dialog, shared by every instance
+_ADD_ACCOUNT_CREATE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+_ADD_ACCOUNT_HINT_STYLE = "QLabel { color: #666; }"
+_ADD_ACCOUNT_STEPS_STYLE = "QWidget { background-color: #151937; border: 1px solid #2d3b8f; border-radius: 8px; padding: 12px; }"
+_ADD_ACCOUNT_STEP_LABEL_STYLE = "QLabel { margin: 4px 0; }"
+_ADD_ACCOUNT_INFO_PANEL_STYLE = "QWidget { background-color: #151937; border: 1px solid #2d3b8f; border-radius: 8px; padding: 8px; }"
+_ADD_ACCOUNT_INFO_STEPS_STYLE = "QLabel { background-color: #0f1438; padding: 8px; border-radius: 4px; color: #c7d2fe; }"
+_ADD_ACCOUNT_COPY_BUTTON_STYLE = "QPushButton { background-color: #4CAF50; color: white; border: none; padding: 8px; border-radius: 4px; font-weight: bold; }"
 
 
 class AddAccountDialog(QDialog):
@@ -1725,19 +2635,7 @@ class AddAccountDialog(QDialog):
         # Button linking to account creation page (left side)
         self.create_account_button = QPushButton(_('create_account'))
         self.create_account_button.setMinimumHeight(28)
-        self.create_account_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.create_account_button.setStyleSheet(_ADD_ACCOUNT_CREATE_BUTTON_STYLE)
         self.create_account_button.clicked.connect(self.open_account_creation_page)
 
         self.add_button = QPushButton(_('add'))
@@ -1830,12 +2728,12 @@ class AddAccountDialog(QDialog):
 
         chrome_desc = QLabel(_('chrome_extension_description'))
         chrome_desc.setWordWrap(True)
-        chrome_desc.setStyleSheet("QLabel { color: #666; }")
+        chrome_desc.setStyleSheet(_ADD_ACCOUNT_HINT_STYLE)
         scroll_layout.addWidget(chrome_desc)
 
         # Step-by-step guide container
         steps_widget = QWidget()
-        steps_widget.setStyleSheet("QWidget { background-color: #151937; border: 1px solid #2d3b8f; border-radius: 8px; padding: 12px; }")
+        steps_widget.setStyleSheet(_ADD_ACCOUNT_STEPS_STYLE)
         steps_layout = QVBoxLayout()
         steps_layout.setSpacing(8)
 
@@ -1849,7 +2747,7 @@ class AddAccountDialog(QDialog):
         for step in steps:
             step_label = QLabel(step)
             step_label.setWordWrap(True)
-            step_label.setStyleSheet("QLabel { margin: 4px 0; }")
+            step_label.setStyleSheet(_ADD_ACCOUNT_STEP_LABEL_STYLE)
             steps_layout.addWidget(step_label)
 
         steps_widget.setLayout(steps_layout)
@@ -1868,7 +2766,7 @@ class AddAccountDialog(QDialog):
         """Construct the information panel"""
         panel = QWidget()
         panel.setMaximumWidth(400)
-        panel.setStyleSheet("QWidget { background-color: #151937; border: 1px solid #2d3b8f; border-radius: 8px; padding: 8px; }")
+        panel.setStyleSheet(_ADD_ACCOUNT_INFO_PANEL_STYLE)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(12, 12, 12, 12)
@@ -1892,50 +2790,15 @@ class AddAccountDialog(QDialog):
 
         steps_label = QLabel(steps_text)
         steps_label.setWordWrap(True)
-        steps_label.setStyleSheet("QLabel { background-color: #0f1438; padding: 8px; border-radius: 4px; color: #c7d2fe; }")
+        steps_label.setStyleSheet(_ADD_ACCOUNT_INFO_STEPS_STYLE)
         layout.addWidget(steps_label)
 
         # JavaScript kodu (gizli, sadece kopyala butonu)
-        self.javascript_code = """(async () => {
-  const request = indexedDB.open("firebaseLocalStorageDb");
-
-  request.onsuccess = function (event) {
-    const db = event.target.result;
-    const tx = db.transaction("firebaseLocalStorage", "readonly");
-    const store = tx.objectStore("firebaseLocalStorage");
-
-    const getAllReq = store.getAll();
-
-    getAllReq.onsuccess = function () {
-      const results = getAllReq.result;
-
-      // get the first record's value
-      const firstValue = results[0]?.value;
-      console.log("Value (object):", firstValue);
-
-      // convert to JSON string
-      const valueString = JSON.stringify(firstValue, null, 2);
-
-      // add a button to copy the value
-      const btn = document.createElement("button");
-      btn.innerText = "-> Copy JSON <--";
-      btn.style.position = "fixed";
-      btn.style.top = "20px";
-      btn.style.right = "20px";
-      btn.style.zIndex = 9999;
-      btn.onclick = () => {
-        navigator.clipboard.writeText(valueString).then(() => {
-          alert("Copied!");
-        });
-      };
-      document.body.appendChild(btn);
-    };
-  };
-})();"""
+        self.javascript_code = _INDEXEDDB_EXTRACTOR_JS
 
         # Kodu kopyala butonu
         self.copy_button = QPushButton(_('copy_javascript'))
-        self.copy_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; border: none; padding: 8px; border-radius: 4px; font-weight: bold; }")
+        self.copy_button.setStyleSheet(_ADD_ACCOUNT_COPY_BUTTON_STYLE)
         self.copy_button.clicked.connect(self.copy_javascript_code)
         layout.addWidget(self.copy_button)
 
@@ -2093,13 +2956,225 @@ class HelpDialog(QDialog):
         return section_widget
 
 
+class ActivationButtonDelegate(QStyledItemDelegate):
+    """Paint the start/stop button of the accounts table and report clicks on it"""
+    clicked = pyqtSignal(str)  # email of the clicked row
+
+    # Button state stored on column-0 items under Qt.UserRole
+    INACTIVE, ACTIVE, BANNED = range(3)
+
+    BUTTON_WIDTH = 70
+    BUTTON_HEIGHT = 28
+    BUTTON_RADIUS = 6
+
+    # (gradient start, gradient end, hover start, hover end, text color, border color or None)
+    _PALETTES = {
+        INACTIVE: ('#10b981', '#059669', '#34d399', '#10b981', '#ffffff', None),
+        ACTIVE: ('#ef4444', '#dc2626', '#f87171', '#ef4444', '#ffffff', None),
+        BANNED: ('#151937', '#151937', '#151937', '#151937', '#64748b', '#1e2555'),
+    }
+
+    def button_rect(self, cell_rect):
+        """The button's rectangle, centered in its cell"""
+        return QRectF(cell_rect.x() + (cell_rect.width() - self.BUTTON_WIDTH) / 2,
+                      cell_rect.y() + (cell_rect.height() - self.BUTTON_HEIGHT) / 2,
+                      self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+
+    def paint(self, painter, option, index):
+        # Let the style draw the row background (selection, alternating colors)
+        self.initStyleOption(option, index)
+        option.text = ''
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        state = index.data(Qt.UserRole)
+        start, end, hover_start, hover_end, text_color, border = self._PALETTES.get(state, self._PALETTES[self.INACTIVE])
+        if state != self.BANNED and option.state & QStyle.State_MouseOver:
+            start, end = hover_start, hover_end
+
+        rect = self.button_rect(option.rect)
+        gradient = QLinearGradient(rect.topLeft(), rect.topRight())
+        gradient.setColorAt(0, QColor(start))
+        gradient.setColorAt(1, QColor(end))
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(border)) if border else Qt.NoPen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawRoundedRect(rect, self.BUTTON_RADIUS, self.BUTTON_RADIUS)
+
+        font = QFont(option.font)
+        font.setPointSize(9)
+        font.setWeight(QFont.DemiBold if state == self.BANNED else QFont.Bold)
+        painter.setFont(font)
+        painter.setPen(QColor(text_color))
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or '')
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.data(Qt.UserRole) != self.BANNED
+                and self.button_rect(option.rect).contains(event.pos())):
+            email = index.sibling(index.row(), 1).data(Qt.DisplayRole)
+            if email:
+                self.clicked.emit(email)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class AccountsTableModel(QAbstractTableModel):
+    """Account rows for the main table; cell values are computed only when the view asks"""
+
+    COLUMN_COUNT = 4
+    _RIGHT_ALIGNED = int(Qt.AlignRight | Qt.AlignVCenter)
+
+    # Row brushes by account state: (background, text), built once and shared by every cell
+    _BANNED_COLORS = (QBrush(QColor(30, 37, 85, 40)), QBrush(QColor(148, 163, 184)))  # Subtle dark overlay, muted text
+    _ACTIVE_COLORS = (QBrush(QColor(59, 130, 246, 60)), QBrush(QColor(255, 255, 255)))  # blue-500 highlight, white text
+    _UNHEALTHY_COLORS = (QBrush(QColor(239, 68, 68, 60)), QBrush(QColor(254, 226, 226)))  # red-500 highlight, light red text
+    _DEFAULT_COLORS = (QBrush(QColor(255, 255, 255, 0)), QBrush(QColor(224, 231, 255)))  # Transparent, bright text
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accounts = []  # (email, token_expiry, health_status, limit_info) rows, ordered by email
+        self._row_by_email = {}
+        self._active_account = None
+        self._now_ms = 0
+        self._headers = []
+        self._texts = []  # Translated strings indexed by TextKey
+
+    def set_accounts(self, accounts, active_account):
+        """Replace every row at once"""
+        self.beginResetModel()
+        self._accounts = accounts
+        self._row_by_email = {row[0]: i for i, row in enumerate(accounts)}
+        self._active_account = active_account
+        self._now_ms = int(time.time() * 1000)
+        # Snapshot the translations once per reload; language changes reload the table
+        self._texts = [_i(key) for key in TextKey]
+        self.endResetModel()
+
+    def set_active_account(self, email):
+        """Move the active marker, repainting only the previous and new active rows"""
+        previous, self._active_account = self._active_account, email
+        for changed in (previous, email):
+            self._row_changed(self._row_by_email.get(changed))
+
+    def update_account(self, summary):
+        """Insert or replace a single row from an AccountManager.get_account_summary() tuple"""
+        email = summary[0]
+        self._now_ms = int(time.time() * 1000)
+        row = self._row_by_email.get(email)
+        if row is not None:
+            self._accounts[row] = summary
+            self._row_changed(row)
+            return
+
+        # Keep the email order the database returns
+        row = bisect.bisect_left([account[0] for account in self._accounts], email)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._accounts.insert(row, summary)
+        self._row_by_email = {account[0]: i for i, account in enumerate(self._accounts)}
+        self.endInsertRows()
+
+    def remove_account(self, email):
+        """Drop the row of a deleted account"""
+        row = self._row_by_email.get(email)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._accounts[row]
+        self._row_by_email = {account[0]: i for i, account in enumerate(self._accounts)}
+        self.endRemoveRows()
+
+    def _row_changed(self, row):
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+
+    def set_headers(self, labels):
+        """Set the (translated) column titles"""
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def email_at(self, row):
+        """Email of the account shown in a row, or None"""
+        return self._accounts[row][0] if 0 <= row < len(self._accounts) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        email, expiration_time, health_status, limit_info = self._accounts[index.row()]
+        column = index.column()
+        texts = self._texts
+        is_banned = health_status == HealthStatus.BANNED
+        is_active = email == self._active_account
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                # Label of the button painted by ActivationButtonDelegate
+                if is_banned:
+                    return texts[TextKey.button_banned]
+                return texts[TextKey.button_stop] if is_active else texts[TextKey.button_start]
+            if column == 1:
+                return email
+            if column == 2:
+                return self._status_text(texts, expiration_time, is_banned, is_active)
+            # Stored limit info (defaults to "Not Updated")
+            return limit_info or texts[TextKey.status_not_updated]
+
+        if role == Qt.UserRole and column == 0:
+            if is_banned:
+                return ActivationButtonDelegate.BANNED
+            return ActivationButtonDelegate.ACTIVE if is_active else ActivationButtonDelegate.INACTIVE
+
+        if column == 0:
+            # The button column keeps the table's own background
+            return None
+        if role == Qt.TextAlignmentRole and column >= 2:
+            return self._RIGHT_ALIGNED
+        if role in (Qt.BackgroundRole, Qt.ForegroundRole):
+            if is_banned:
+                colors = self._BANNED_COLORS
+            elif is_active:
+                colors = self._ACTIVE_COLORS
+            elif health_status == HealthStatus.UNHEALTHY:
+                colors = self._UNHEALTHY_COLORS
+            else:
+                colors = self._DEFAULT_COLORS
+            return colors[0] if role == Qt.BackgroundRole else colors[1]
+        return None
+
+    def _status_text(self, texts, expiration_time, is_banned, is_active):
+        if is_banned:
+            return texts[TextKey.status_banned]
+        if not isinstance(expiration_time, (int, float)) or isinstance(expiration_time, bool):
+            # token_expiry is NULL (or junk) when the stored JSON had no expirationTime
+            return texts[TextKey.status_error]
+        status = texts[TextKey.status_token_expired] if self._now_ms >= expiration_time else texts[TextKey.status_active]
+        # Append proxy-active marker for selected account
+        if is_active:
+            status += texts[TextKey.status_proxy_active]
+        return status
+
+
 class MainWindow(QMainWindow):
     # Signal emitted when an account is added via the bridge
     bridge_account_added = pyqtSignal(str)
 
     def __init__(self):
         super().__init__()
-        self.account_manager = AccountManager()
+        self.account_manager = get_default_account_manager()
         self.proxy_manager = MitmProxyManager()
         self.proxy_enabled = False
 
@@ -2111,30 +3186,18 @@ class MainWindow(QMainWindow):
         self.bridge_account_added.connect(self.refresh_table_after_bridge_add)
 
         self.init_ui()
+        # Status updates from the proxy manager are queued if sent off the GUI thread
+        self.proxy_manager.status.connect(self.status_bar.showMessage)
         self.load_accounts()
 
         # Configure and start bridge components after the UI loads
         self.setup_bridge_system()
 
-        # Timer for checking proxy status
-        self.proxy_timer = QTimer()
-        self.proxy_timer.timeout.connect(self.check_proxy_status)
-        self.proxy_timer.start(5000)  # Check every 5 seconds
-
-        # Timer for checking ban notifications
-        self.ban_timer = QTimer()
-        self.ban_timer.timeout.connect(self.check_ban_notifications)
-        self.ban_timer.start(1000)  # Check every second
-
-        # Timer for automatic token renewal
-        self.token_renewal_timer = QTimer()
-        self.token_renewal_timer.timeout.connect(self.auto_renew_tokens)
-        self.token_renewal_timer.start(60000)  # Check every 60 seconds (60000 ms)
-
-        # Timer for refreshing the active account
-        self.active_account_refresh_timer = QTimer()
-        self.active_account_refresh_timer.timeout.connect(self.refresh_active_account)
-        self.active_account_refresh_timer.start(60000)  # Refresh every 60 seconds
+        # Single 1 Hz timer driving every periodic job, so they share wakeups
+        self._tick_count = 0
+        self._master_timer = QTimer()
+        self._master_timer.timeout.connect(self._tick)
+        self._master_timer.start(1000)
 
         # Timer for resetting the status message
         self.status_reset_timer = QTimer()
@@ -2146,8 +3209,20 @@ class MainWindow(QMainWindow):
 
         # Placeholders for background token workers
         self.token_worker = None
+        self.renewal_worker = None
         self.token_progress_dialog = None
 
+    def _tick(self):
+        """Dispatch periodic jobs from the master timer at their own cadence"""
+        self._tick_count += 1
+        self.check_ban_notifications()  # Every second
+        if self._tick_count % 5 == 0:
+            self.check_proxy_status()  # Every 5 seconds
+        if self._tick_count % 60 == 0:
+            self.auto_renew_tokens()  # Every 60 seconds
+            if self.proxy_enabled:
+                self.refresh_active_account()
+
     def setup_bridge_system(self):
         """Configure the bridge system and start its server"""
         try:
@@ -2314,9 +3389,11 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
 
         # Accounts table setup
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([_('current'), _('email'), _('status'), _('limit')])
+        # Rows are served lazily by the model, so only visible cells are ever computed
+        self.accounts_model = AccountsTableModel(self)
+        self.accounts_model.set_headers([_('current'), _('email'), _('status'), _('limit')])
+        self.table = QTableView()
+        self.table.setModel(self.accounts_model)
 
         # Styling for cleaner table appearance
         self.table.setAlternatingRowColors(True)
@@ -2326,6 +3403,12 @@ class MainWindow(QMainWindow):
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setFocusPolicy(Qt.NoFocus)
+        self.table.viewport().setAttribute(Qt.WA_Hover)  # Hover feedback on the painted buttons
+
+        # Start/stop buttons are painted by a delegate rather than per-row widgets
+        self.activation_delegate = ActivationButtonDelegate(self.table)
+        self.activation_delegate.clicked.connect(self.toggle_account_activation)
+        self.table.setItemDelegateForColumn(0, self.activation_delegate)
 
         # Modern dark theme table styles removed - using style.qss instead
 
@@ -2340,6 +3423,9 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Size status column to contents
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Size limit column to contents
         header.resizeSection(0, 90)  # Smaller width for centered button
+        # Size the content-fitted columns from visible rows only, so a model reset
+        # doesn't make the header query data() for up to 1000 offscreen rows
+        header.setResizeContentsPrecision(0)
         header.setFixedHeight(40)  # Taller header for modern look
 
         layout.addWidget(self.table)
@@ -2348,158 +3434,24 @@ class MainWindow(QMainWindow):
 
     def load_accounts(self, preserve_limits=False):
         """Populate the table with account data"""
-        accounts = self.account_manager.get_accounts_with_health_and_limits()
-
-        self.table.setRowCount(len(accounts))
-        active_account = self.account_manager.get_active_account()
-
-        for row, (email, account_json, health_status, limit_info) in enumerate(accounts):
-            # Activation button rendered in column 0
-            activation_button = QPushButton()
-            activation_button.setFixedSize(70, 28)
-            activation_button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #2d3b8f;
-                    border-radius: 6px;
-                    font-weight: 600;
-                    font-size: 9pt;
-                    text-align: center;
-                    padding: 6px 10px;
-                    background-color: #1e2555;
-                    color: #c7d2fe;
-                }
-                QPushButton:hover {
-                    background-color: #2d3b8f;
-                    border-color: #4c51bf;
-                }
-                QPushButton:pressed {
-                    background-color: #1a1f4d;
-                }
-            """)
-
-            # Determine button styling based on status
-            is_active = (email == active_account)
-            is_banned = (health_status == _('status_banned_key'))
-
-            if is_banned:
-                activation_button.setText(_('button_banned'))
-                activation_button.setStyleSheet(activation_button.styleSheet() + """
-                    QPushButton {
-                        background-color: #151937;
-                        color: #64748b;
-                        border-color: #1e2555;
-                        font-size: 9pt;
-                    }
-                """)
-                activation_button.setEnabled(False)
-            elif is_active:
-                activation_button.setText(_('button_stop'))
-                activation_button.setStyleSheet(activation_button.styleSheet() + """
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                   stop:0 #ef4444, stop:1 #dc2626);
-                        color: #ffffff;
-                        border: none;
-                        font-size: 9pt;
-                        font-weight: 700;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                   stop:0 #f87171, stop:1 #ef4444);
-                    }
-                """)
-            else:
-                activation_button.setText(_('button_start'))
-                activation_button.setStyleSheet(activation_button.styleSheet() + """
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                   stop:0 #10b981, stop:1 #059669);
-                        color: #ffffff;
-                        border: none;
-                        font-size: 9pt;
-                        font-weight: 700;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                   stop:0 #34d399, stop:1 #10b981);
-                    }
-                """)
-
-            # Connect button click handler
-            activation_button.clicked.connect(lambda checked, e=email: self.toggle_account_activation(e))
-            self.table.setCellWidget(row, 0, activation_button)
-
-            # Email column (1)
-            email_item = QTableWidgetItem(email)
-            self.table.setItem(row, 1, email_item)
-
-            # Status column (2)
-            try:
-                # Check whether account is banned
-                if health_status == _('status_banned_key'):
-                    status = _('status_banned')
-                else:
-                    account_data = json.loads(account_json)
-                    expiration_time = account_data['stsTokenManager']['expirationTime']
-                    current_time = int(time.time() * 1000)
-
-                    if current_time >= expiration_time:
-                        status = _('status_token_expired')
-                    else:
-                        status = _('status_active')
-
-                    # Append proxy-active marker for selected account
-                    if email == active_account:
-                        status += _('status_proxy_active')
-
-            except:
-                status = _('status_error')
-
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, 2, status_item)
-
-            # Limit column (3) using stored info (defaults to "Not Updated")
-            limit_item = QTableWidgetItem(limit_info or _('status_not_updated'))
-            limit_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, 3, limit_item)
-
-            # Determine row styling based on account state
-            from PyQt5.QtGui import QColor, QBrush
-
-            if health_status == 'banned':
-                # Banned account: darker background with muted text
-                bg_color = QColor(30, 37, 85, 40)  # Very subtle dark overlay
-                text_color = QColor(148, 163, 184)  # Lighter gray for better readability
-            elif email == active_account:
-                # Active account: blue highlight
-                bg_color = QColor(59, 130, 246, 60)  # blue-500 with moderate opacity
-                text_color = QColor(255, 255, 255)  # Pure white for contrast
-            elif health_status == 'unhealthy':
-                # Unhealthy account: red highlight
-                bg_color = QColor(239, 68, 68, 60)  # red-500 with moderate opacity
-                text_color = QColor(254, 226, 226)  # Light red tint
-            else:
-                # Default state: transparent background with high-contrast text
-                bg_color = QColor(255, 255, 255, 0)  # transparent
-                text_color = QColor(224, 231, 255)  # Bright text for readability
-
-            # Apply styling to all data columns (skip button column)
-            for col in range(1, 4):
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(bg_color)
-                    item.setForeground(QBrush(text_color))
+        self.accounts_model.set_accounts(self.account_manager.get_account_summaries(),
+                                         self.account_manager.get_active_account())
+
+    def update_account_row(self, email):
+        """Re-read one account from the database and update, add or drop its row"""
+        summary = self.account_manager.get_account_summary(email)
+        if summary is None:
+            self.accounts_model.remove_account(email)
+        else:
+            self.accounts_model.update_account(summary)
 
     def toggle_account_activation(self, email):
         """Toggle account activation and start proxy if needed"""
 
         # Block activation when account is banned
-        accounts_with_health = self.account_manager.get_accounts_with_health()
-        for acc_email, _, acc_health in accounts_with_health:
-            if acc_email == email and acc_health == 'banned':
-                self.show_status_message(f"{email} is banned and cannot be activated", 5000)
-                return
+        if self.account_manager.get_account_health(email) == HealthStatus.BANNED:
+            self.show_status_message(f"{email} is banned and cannot be activated", 5000)
+            return
 
         # Compare with currently active account
         active_account = self.account_manager.get_active_account()
@@ -2522,24 +3474,16 @@ class MainWindow(QMainWindow):
 
     def show_context_menu(self, position):
         """Show context menu for the table"""
-        item = self.table.itemAt(position)
-        if item is None:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
 
-        row = item.row()
-        email_item = self.table.item(row, 1)  # Email is in column 1
-        if not email_item:
+        email = self.accounts_model.email_at(index.row())
+        if not email:
             return
 
-        email = email_item.text()
-
         # Determine account health status
-        accounts_with_health = self.account_manager.get_accounts_with_health()
-        health_status = None
-        for acc_email, _, acc_health in accounts_with_health:
-            if acc_email == email:
-                health_status = acc_health
-                break
+        health_status = self.account_manager.get_account_health(email)
 
         # Create context menu actions
         menu = QMenu(self)
@@ -2552,7 +3496,7 @@ class MainWindow(QMainWindow):
                 deactivate_action.triggered.connect(lambda: self.deactivate_account(email))
                 menu.addAction(deactivate_action)
             else:
-                if health_status != 'banned':
+                if health_status != HealthStatus.BANNED:
                     activate_action = QAction("🟢 Activate", self)
                     activate_action.triggered.connect(lambda: self.activate_account(email))
                     menu.addAction(activate_action)
@@ -2571,7 +3515,7 @@ class MainWindow(QMainWindow):
         """Deactivate the specified account"""
         try:
             if self.account_manager.clear_active_account():
-                self.load_accounts(preserve_limits=True)
+                self.accounts_model.set_active_account(None)
                 self.show_status_message(f"{email} has been deactivated", 3000)
             else:
                 self.show_status_message(_('account_activation_failed'), 3000)
@@ -2589,7 +3533,7 @@ class MainWindow(QMainWindow):
 
             if reply == QMessageBox.Yes:
                 if self.account_manager.delete_account(email):
-                    self.load_accounts(preserve_limits=True)
+                    self.accounts_model.remove_account(email)
                     self.show_status_message(f"{email} has been deleted", 3000)
                 else:
                     self.show_status_message("Account could not be deleted", 3000)
@@ -2602,10 +3546,17 @@ class MainWindow(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             json_data = dialog.get_json_data()
             if json_data:
-                success, message = self.account_manager.add_account(json_data)
+                if json_data.startswith('['):
+                    # A JSON array of accounts is imported in one batch
+                    try:
+                        success, message = self.account_manager.add_accounts_many(_json_loads(json_data))
+                    except ValueError:
+                        success, message = False, _('invalid_json')
+                else:
+                    success, message = self.account_manager.add_account(json_data)
                 if success:
                     self.load_accounts()
-                    self.status_bar.showMessage(_('account_added_success'), 3000)
+                    self.status_bar.showMessage(message, 3000)
                 else:
                     self.status_bar.showMessage(f"{_('error')}: {message}", 5000)
 
@@ -2622,7 +3573,7 @@ class MainWindow(QMainWindow):
         self.progress_dialog.show()
 
         # Launch background worker
-        self.worker = TokenRefreshWorker(accounts, self.proxy_enabled)
+        self.worker = TokenRefreshWorker(accounts, self.proxy_enabled, self.account_manager, bypass_backoff=True)
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.refresh_finished)
         self.worker.error.connect(self.refresh_error)
@@ -2633,8 +3584,9 @@ class MainWindow(QMainWindow):
         self.add_account_button.setEnabled(False)
 
     def update_progress(self, value, text):
-        """Update progress dialog state"""
-        self.progress_dialog.setValue(value)
+        """Update progress dialog state (a negative value only updates the label)"""
+        if value >= 0:
+            self.progress_dialog.setValue(value)
         self.progress_dialog.setLabelText(text)
 
     def refresh_finished(self, results):
@@ -2693,10 +3645,6 @@ class MainWindow(QMainWindow):
                     self.proxy_stop_button.setVisible(True)
                     self.proxy_stop_button.setEnabled(True)
 
-                    # Ensure refresh timer runs
-                    if hasattr(self, 'active_account_refresh_timer') and not self.active_account_refresh_timer.isActive():
-                        self.active_account_refresh_timer.start(60000)
-
                     # Activate the account now that proxy is ready
                     self.activate_account(email)
 
@@ -2757,10 +3705,6 @@ class MainWindow(QMainWindow):
                     self.proxy_stop_button.setVisible(True)
                     self.proxy_stop_button.setEnabled(True)
 
-                    # Ensure refresh timer runs
-                    if hasattr(self, 'active_account_refresh_timer') and not self.active_account_refresh_timer.isActive():
-                        self.active_account_refresh_timer.start(60000)
-
                     # Refresh table to reflect proxy state
                     self.load_accounts()
 
@@ -2794,19 +3738,14 @@ class MainWindow(QMainWindow):
             # Clear active account reference
             self.account_manager.clear_active_account()
 
-            # Stop active account refresh timer
-            if hasattr(self, 'active_account_refresh_timer') and self.active_account_refresh_timer.isActive():
-                self.active_account_refresh_timer.stop()
-                print("🔄 Active account refresh timer stopped")
-
             self.proxy_enabled = False
             self.proxy_start_button.setEnabled(True)
             self.proxy_start_button.setText(_('proxy_start'))
             self.proxy_stop_button.setVisible(False)
             self.proxy_stop_button.setEnabled(False)
 
-            # Refresh displayed accounts
-            self.load_accounts(preserve_limits=True)
+            # Only the previously active row changes
+            self.accounts_model.set_active_account(None)
 
             self.status_bar.showMessage(_('proxy_stopped'), 3000)
         except Exception as e:
@@ -2816,22 +3755,20 @@ class MainWindow(QMainWindow):
         """Activate the selected account"""
         try:
             # Retrieve account state/details
-            accounts_with_health = self.account_manager.get_accounts_with_health()
             account_data = None
             health_status = None
 
-            for acc_email, acc_json, acc_health in accounts_with_health:
-                if acc_email == email:
-                    account_data = json.loads(acc_json)
-                    health_status = acc_health
-                    break
+            account = self.account_manager.get_account_with_health(email)
+            if account:
+                account_data = self.account_manager.get_account_dict(email, account[0])
+                health_status = account[1]
 
             if not account_data:
                 self.status_bar.showMessage(_('account_not_found'), 3000)
                 return
 
             # Prevent activation for banned accounts
-            if health_status == 'banned':
+            if health_status == HealthStatus.BANNED:
                 self.status_bar.showMessage(_('account_banned_cannot_activate').format(email), 5000)
                 return
 
@@ -2863,7 +3800,7 @@ class MainWindow(QMainWindow):
         self.token_progress_dialog.show()
 
         # Launch token worker thread
-        self.token_worker = TokenWorker(email, account_data, self.proxy_enabled)
+        self.token_worker = TokenWorker(email, account_data, self.proxy_enabled, self.account_manager)
         self.token_worker.progress.connect(self.update_token_progress)
         self.token_worker.finished.connect(self.token_refresh_finished)
         self.token_worker.error.connect(self.token_refresh_error)
@@ -2882,9 +3819,12 @@ class MainWindow(QMainWindow):
 
         self.status_bar.showMessage(message, 3000)
 
+        # The worker changed this account's token and health either way; redraw only its row
+        email = self.token_worker.email
+        self.update_account_row(email)
+
         if success:
             # Token refreshed successfully; activate account
-            email = self.token_worker.email
             self._complete_account_activation(email)
 
         # Clear worker reference
@@ -2903,7 +3843,7 @@ class MainWindow(QMainWindow):
         """Finalize account activation flow"""
         try:
             if self.account_manager.set_active_account(email):
-                self.load_accounts(preserve_limits=True)
+                self.accounts_model.set_active_account(email)
                 self.status_bar.showMessage(_('account_activated').format(email), 3000)
                 self.notify_proxy_active_account_change()
 
@@ -2936,13 +3876,7 @@ class MainWindow(QMainWindow):
             os_info = get_os_info()
 
             # Retrieve active account token
-            accounts = self.account_manager.get_accounts()
-            account_data = None
-
-            for acc_email, acc_json in accounts:
-                if acc_email == email:
-                    account_data = json.loads(acc_json)
-                    break
+            account_data = self.account_manager.get_account_dict(email)
 
             if not account_data:
                 print(f"❌ Account not found: {email}")
@@ -2960,7 +3894,7 @@ class MainWindow(QMainWindow):
                 'X-Warp-Os-Name': os_info['name'],
                 'X-Warp-Os-Version': os_info['version'],
                 'Accept': '*/*',
-                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept-Encoding': ACCEPT_ENCODING,
                 'Connection': 'keep-alive'
             }
 
@@ -3374,11 +4308,11 @@ class MainWindow(QMainWindow):
             }
 
             # Invoke the API directly without proxying
-            proxies = {'http': None, 'https': None}
-            response = requests.post(url, headers=headers, json=payload, timeout=60, verify=False, proxies=proxies)
+            response = _DIRECT_HTTP_SESSION.post(url, headers=headers, data=_json_dumps_bytes(payload), timeout=60,
+                                                 verify=False)
 
             if response.status_code == 200:
-                user_settings_data = response.json()
+                user_settings_data = _json_loads(response.content)
 
                 # Persist response to user_settings.json
                 with open("user_settings.json", 'w', encoding='utf-8') as f:
@@ -3418,41 +4352,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Proxy notification error: {e}")
 
-    def refresh_account_token(self, email, account_data):
-        """Refresh the token for a specific account"""
-        try:
-            refresh_token = account_data['stsTokenManager']['refreshToken']
-            api_key = account_data['apiKey']
-
-            url = f"https://securetoken.googleapis.com/v1/token?key={api_key}"
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'WarpAccountManager/1.0'  # Tag request with manager-specific user agent
-            }
-            data = {
-                'grant_type': 'refresh_token',
-                'refresh_token': refresh_token
-            }
-
-            # Establish direct connection without proxy
-            proxies = {'http': None, 'https': None} if self.proxy_enabled else None
-            response = requests.post(url, json=data, headers=headers, timeout=30,
-                                   verify=not self.proxy_enabled, proxies=proxies)
-
-            if response.status_code == 200:
-                token_data = response.json()
-                new_token_data = {
-                    'accessToken': token_data['access_token'],
-                    'refreshToken': token_data['refresh_token'],
-                    'expirationTime': int(time.time() * 1000) + (int(token_data['expires_in']) * 1000)
-                }
-
-                return self.account_manager.update_account_token(email, new_token_data)
-            return False
-        except Exception as e:
-            print(f"Token refresh error: {e}")
-            return False
-
     def check_proxy_status(self):
         """Monitor proxy status and handle unexpected stops"""
         if self.proxy_enabled:
@@ -3465,7 +4364,7 @@ class MainWindow(QMainWindow):
                 self.proxy_stop_button.setEnabled(False)
                 ProxyManager.disable_proxy()
                 self.account_manager.clear_active_account()
-                self.load_accounts(preserve_limits=True)
+                self.accounts_model.set_active_account(None)
 
                 self.status_bar.showMessage(_('proxy_unexpected_stop'), 5000)
 
@@ -3489,6 +4388,9 @@ class MainWindow(QMainWindow):
 
                         print(f"Ban notification received: {banned_email} (timestamp: {timestamp})")
 
+                        # The proxy script cleared active_account in its own process
+                        self.account_manager.invalidate_settings_cache()
+
                         # Refresh account list
                         self.load_accounts(preserve_limits=True)
 
@@ -3506,11 +4408,8 @@ class MainWindow(QMainWindow):
     def refresh_active_account(self):
         """Refresh active account token and limit every 60 seconds"""
         try:
-            # Stop timer if proxy is no longer active
+            # Nothing to refresh while the proxy is off
             if not self.proxy_enabled:
-                if self.active_account_refresh_timer.isActive():
-                    self.active_account_refresh_timer.stop()
-                    print("🔄 Active account refresh timer stopped (proxy disabled)")
                 return
 
             # Retrieve active account email
@@ -3520,23 +4419,21 @@ class MainWindow(QMainWindow):
 
             print(f"🔄 Refreshing active account: {active_email}")
 
-            # Fetch account data from database
-            accounts_with_health = self.account_manager.get_accounts_with_health_and_limits()
+            # Fetch account data from database (parsed JSON is reused while unchanged)
             active_account_data = None
             health_status = None
 
-            for email, account_json, acc_health, limit_info in accounts_with_health:
-                if email == active_email:
-                    active_account_data = json.loads(account_json)
-                    health_status = acc_health
-                    break
+            account = self.account_manager.get_account_with_health(active_email)
+            if account:
+                active_account_data = self.account_manager.get_account_dict(active_email, account[0])
+                health_status = account[1]
 
             if not active_account_data:
                 print(f"❌ Active account not found: {active_email}")
                 return
 
             # Skip accounts that are banned
-            if health_status == 'banned':
+            if health_status == HealthStatus.BANNED:
                 print(f"⛔ Active account banned, skipping: {active_email}")
                 return
 
@@ -3547,20 +4444,29 @@ class MainWindow(QMainWindow):
             print(f"Active account refresh error: {e}")
 
     def _refresh_single_active_account(self, email, account_data):
-        """Refresh token and limits for the given active account"""
+        """Refresh token (only when close to expiry) and limits for the given active account"""
         try:
+            if not token_needs_refresh(account_data['stsTokenManager']['expirationTime']):
+                # Token still fresh: skip the Firebase round trip and only update limits
+                self._update_active_account_limit(email)
+                self.update_account_row(email)
+                return
+
             # Renew token
-            if self.renew_single_token(email, account_data):
+            renewed = self.renew_single_token(email, account_data)
+            if renewed is REFRESH_SKIPPED:
+                print(f"⏸️  Active account refresh recently failed, retrying later: {email}")
+            elif renewed:
                 print(f"✅ Active account token renewed: {email}")
 
                 # Update limit metadata
                 self._update_active_account_limit(email)
 
-                # Reload table to reflect limit changes
-                self.load_accounts(preserve_limits=False)
+                # Update the row to reflect limit changes
+                self.update_account_row(email)
             else:
                 print(f"❌ Active account token could not be renewed: {email}")
-                self.account_manager.update_account_health(email, 'unhealthy')
+                self.account_manager.update_account_health(email, HealthStatus.UNHEALTHY)
 
         except Exception as e:
             print(f"Active account refresh error ({email}): {e}")
@@ -3569,250 +4475,95 @@ class MainWindow(QMainWindow):
         """Update cached limit information for the active account"""
         try:
             # Retrieve account data again
-            accounts = self.account_manager.get_accounts()
-            for acc_email, acc_json in accounts:
-                if acc_email == email:
-                    account_data = json.loads(acc_json)
-
-                    # Fetch latest limit info
-                    limit_info = self._get_account_limit_info(account_data)
-                    if limit_info:
-                        used = limit_info.get('requestsUsedSinceLastRefresh', 0)
-                        total = limit_info.get('requestLimit', 0)
-                        limit_text = f"{used}/{total}"
-
-                        self.account_manager.update_account_limit_info(email, limit_text)
-                        print(f"✅ Active account limit updated: {email} - {limit_text}")
-                    else:
-                        self.account_manager.update_account_limit_info(email, "N/A")
-                        print(f"⚠️ Active account limit information unavailable: {email}")
-                    break
-
-        except Exception as e:
-            print(f"Active account limit update error ({email}): {e}")
-
-    def _get_account_limit_info(self, account_data):
-        """Request limit information for an account from Warp API"""
-        try:
-            # Get dynamic OS information
-            os_info = get_os_info()
-
-            access_token = account_data['stsTokenManager']['accessToken']
-
-            url = "https://app.warp.dev/graphql/v2?op=GetRequestLimitInfo"
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {access_token}',
-                'X-Warp-Client-Version': 'v0.2025.08.27.08.11.stable_04',
-                'X-Warp-Os-Category': os_info['category'],
-                'X-Warp-Os-Name': os_info['name'],
-                'X-Warp-Os-Version': os_info['version'],
-                'Accept': '*/*',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'X-Warp-Manager-Request': 'true'
-            }
-
-            query = """
-            query GetRequestLimitInfo($requestContext: RequestContext!) {
-              user(requestContext: $requestContext) {
-                __typename
-                ... on UserOutput {
-                  user {
-                    requestLimitInfo {
-                      isUnlimited
-                      nextRefreshTime
-                      requestLimit
-                      requestsUsedSinceLastRefresh
-                      requestLimitRefreshDuration
-                      isUnlimitedAutosuggestions
-                      acceptedAutosuggestionsLimit
-                      acceptedAutosuggestionsSinceLastRefresh
-                      isUnlimitedVoice
-                      voiceRequestLimit
-                      voiceRequestsUsedSinceLastRefresh
-                      voiceTokenLimit
-                      voiceTokensUsedSinceLastRefresh
-                      isUnlimitedCodebaseIndices
-                      maxCodebaseIndices
-                      maxFilesPerRepo
-                      embeddingGenerationBatchSize
-                    }
-                  }
-                }
-                ... on UserFacingError {
-                  error {
-                    __typename
-                    ... on SharedObjectsLimitExceeded {
-                      limit
-                      objectType
-                      message
-                    }
-                    ... on PersonalObjectsLimitExceeded {
-                      limit
-                      objectType
-                      message
-                    }
-                    ... on AccountDelinquencyError {
-                      message
-                    }
-                    ... on GenericStringObjectUniqueKeyConflict {
-                      message
-                    }
-                  }
-                  responseContext {
-                    serverVersion
-                  }
-                }
-              }
-            }
-            """
-
-            payload = {
-                "query": query,
-                "variables": {
-                    "requestContext": {
-                        "clientContext": {
-                            "version": "v0.2025.08.27.08.11.stable_04"
-                        },
-                        "osContext": {
-                            "category": os_info['category'],
-                            "linuxKernelVersion": None,
-                            "name": os_info['category'],
-                            "version": os_info['version']
-                        }
-                    }
-                },
-                "operationName": "GetRequestLimitInfo"
-            }
+            account_data = self.account_manager.get_account_dict(email)
+            if account_data:
+                # Fetch latest limit info
+                limit_info = request_limit_info(account_data)
+                if limit_info:
+                    used = limit_info.get('requestsUsedSinceLastRefresh', 0)
+                    total = limit_info.get('requestLimit', 0)
+                    limit_text = f"{used}/{total}"
 
-            # Connect without using the proxy
-            proxies = {'http': None, 'https': None}
-            response = requests.post(url, headers=headers, json=payload, timeout=30,
-                                   verify=True, proxies=proxies)
+                    self.account_manager.update_account_limit_info(email, limit_text)
+                    print(f"✅ Active account limit updated: {email} - {limit_text}")
+                else:
+                    self.account_manager.update_account_limit_info(email, "N/A")
+                    print(f"⚠️ Active account limit information unavailable: {email}")
 
-            if response.status_code == 200:
-                data = response.json()
-                if 'data' in data and 'user' in data['data']:
-                    user_data = data['data']['user']
-                    if user_data.get('__typename') == 'UserOutput':
-                        return user_data['user']['requestLimitInfo']
-            return None
         except Exception as e:
-            print(f"Limit information retrieval error: {e}")
-            return None
+            print(f"Active account limit update error ({email}): {e}")
 
     def auto_renew_tokens(self):
         """Automatically refresh tokens every minute"""
         try:
             print("🔄 Starting automatic token check...")
 
-            # Fetch all accounts with status info
-            accounts = self.account_manager.get_accounts_with_health_and_limits()
+            # Fetch all accounts with status info; account data is loaded only when needed
+            accounts = self.account_manager.get_account_summaries()
 
             if not accounts:
                 return
 
-            expired_count = 0
-            renewed_count = 0
+            # Skip this tick if the previous renewal is still running
+            if self.renewal_worker and self.renewal_worker.isRunning():
+                return
+
+            expiring = []
 
-            for email, account_json, health_status, limit_info in accounts:
+            # Renew tokens shortly before expiration
+            current_time = int(time.time() * 1000)
+            for email, expiration_time, health_status, limit_info in accounts:
                 # Skip banned accounts
-                if health_status == 'banned':
+                if health_status == HealthStatus.BANNED:
                     continue
-
-                try:
-                    account_data = json.loads(account_json)
-                    expiration_time = account_data['stsTokenManager']['expirationTime']
-                    current_time = int(time.time() * 1000)
-
-                    # Renew tokens one minute before expiration
-                    buffer_time = 1 * 60 * 1000
-                    if current_time >= (expiration_time - buffer_time):
-                        expired_count += 1
-                        print(f"⏰ Token expiring soon: {email}")
-
-                        # Attempt token refresh
-                        if self.renew_single_token(email, account_data):
-                            renewed_count += 1
-                            print(f"✅ Token yenilendi: {email}")
-                        else:
-                            print(f"❌ Token yenilenemedi: {email}")
-
-                except Exception as e:
-                    print(f"Token check error ({email}): {e}")
+                # token_expiry is NULL when the stored JSON had no expirationTime; skip just that account
+                if not isinstance(expiration_time, (int, float)) or isinstance(expiration_time, bool):
+                    print(f"Token check skipped, no expiration time: {email}")
                     continue
+                if token_needs_refresh(expiration_time, current_time):
+                    print(f"⏰ Token expiring soon: {email}")
+                    expiring.append(email)
 
-            # Present summary message
-            if expired_count > 0:
-                if renewed_count > 0:
-                    self.show_status_message(f"🔄 Refreshed {renewed_count}/{expired_count} expiring tokens", 5000)
-                    # Reload accounts to reflect changes
-                    self.load_accounts(preserve_limits=True)
-                else:
-                    self.show_status_message(f"⚠️ Failed to refresh {expired_count} expiring tokens", 5000)
-            else:
+            if not expiring:
                 print("✅ All tokens are valid")
+                return
+
+            # The HTTPS round trips run on a worker thread so the window stays responsive
+            self.renewal_worker = TokenRenewalWorker(expiring, self.account_manager)
+            self.renewal_worker.finished.connect(self.token_renewal_finished)
+            self.renewal_worker.start()
 
         except Exception as e:
             print(f"Automatic token renewal error: {e}")
             self.show_status_message("❌ Token check failed", 3000)
 
-    def renew_single_token(self, email, account_data):
-        """Refresh the token for a single account"""
-        try:
-            refresh_token = account_data['stsTokenManager']['refreshToken']
-            api_key = account_data.get('apiKey')
-
-            if not api_key:
-                raise ValueError("Firebase API key was not found")
-
-            # Firebase token refresh endpoint
-            url = f"https://securetoken.googleapis.com/v1/token?key={api_key}"
-
-            payload = {
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token
-            }
-
-            headers = {
-                "Content-Type": "application/json"
-            }
-
-            # Bypass proxy to call Firebase directly
-            proxies = {'http': None, 'https': None}
-
-            response = requests.post(url, json=payload, headers=headers,
-                                   timeout=30, verify=True, proxies=proxies)
-
-            if response.status_code == 200:
-                token_data = response.json()
-
-                # Update token details
-                new_access_token = token_data['access_token']
-                new_refresh_token = token_data.get('refresh_token', refresh_token)
-                expires_in = int(token_data['expires_in']) * 1000
-
-                # Compute new expiration time
-                new_expiration_time = int(time.time() * 1000) + expires_in
-
-                # Update in-memory account data
-                account_data['stsTokenManager']['accessToken'] = new_access_token
-                account_data['stsTokenManager']['refreshToken'] = new_refresh_token
-                account_data['stsTokenManager']['expirationTime'] = new_expiration_time
-
-                # Persist changes to database
-                updated_json = json.dumps(account_data)
-                self.account_manager.update_account(email, updated_json)
-
-                return True
-            else:
-                print(f"Token refresh error: {response.status_code} - {response.text}")
-                return False
+    def token_renewal_finished(self, renewed_count, expired_count):
+        """Report the result of a background token renewal"""
+        # Keep self.renewal_worker: this slot runs while run() may still be returning, and
+        # dropping the last reference could destroy a live QThread. The next tick replaces
+        # it only once isRunning() is False.
+        if expired_count == 0:
+            # Every expiring account is still in its failure backoff; nothing was attempted
+            return
+        if renewed_count > 0:
+            self.show_status_message(f"🔄 Refreshed {renewed_count}/{expired_count} expiring tokens", 5000)
+            # Reload accounts to reflect changes
+            self.load_accounts(preserve_limits=True)
+        else:
+            self.show_status_message(f"⚠️ Failed to refresh {expired_count} expiring tokens", 5000)
 
-        except Exception as e:
-            print(f"Token refresh error ({email}): {e}")
+    def renew_single_token(self, email, account_data):
+        """Refresh the token for a single account; returns REFRESH_SKIPPED during a failure backoff"""
+        new_token_data = _coalesced_refresh(email, request_token_renewal, email, account_data)
+        if new_token_data is REFRESH_SKIPPED:
+            return REFRESH_SKIPPED
+        if not new_token_data:
             return False
 
+        # Update in-memory account data, then persist the new token fields
+        account_data['stsTokenManager'].update(new_token_data)
+        return self.account_manager.update_account_token(email, new_token_data)
+
     def reset_status_message(self):
         """Restore the default status bar message"""
         debug_mode = os.path.exists("debug.txt")
@@ -3855,7 +4606,7 @@ class MainWindow(QMainWindow):
         self.help_button.setText(_('help'))
 
         # Update table headers
-        self.table.setHorizontalHeaderLabels([_('current'), _('email'), _('status'), _('limit')])
+        self.accounts_model.set_headers([_('current'), _('email'), _('status'), _('limit')])
 
         # Reset status bar message to default
         debug_mode = os.path.exists("debug.txt")
@@ -3881,7 +4632,10 @@ class MainWindow(QMainWindow):
         """Refresh table after bridge addition (runs on main thread)"""
         try:
             print(f"🔄 Ana thread'de tablo yenileniyor... ({email})")
-            self.load_accounts(preserve_limits=True)
+            if email:
+                self.update_account_row(email)
+            else:
+                self.load_accounts(preserve_limits=True)
 
             # Notify user via status bar
             if email:
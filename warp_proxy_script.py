@@ -12,6 +12,7 @@ import urllib3
 import re
 import random
 import string
+import threading
 from mitmproxy import http
 from mitmproxy.script import concurrent
 from languages import get_language_manager, _
@@ -19,6 +20,9 @@ from languages import get_language_manager, _
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# accounts.health_code value for a banned account (HealthStatus.BANNED in warp_account_manager)
+HEALTH_BANNED = 3
+
 
 def randomize_uuid_string(uuid_str):
     """
@@ -73,29 +77,56 @@ class WarpProxyHandler:
         self.last_trigger_check = 0
         self.last_token_check = 0
         self.user_settings_cache = None
+        # Keep-alive HTTP session for token refreshes, created on first use
+        self._session = None
+        # One long-lived database connection, shared by the concurrent hooks
+        self._conn = None
+        self._db_lock = threading.Lock()
+
+    def _get_connection(self):
+        """Return the shared SQLite connection, opening it on first use (call with _db_lock held)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn = conn
+        return self._conn
+
+    def _get_session(self):
+        """Return the pooled requests session, creating it on first use"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util import Retry
+
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                # Connection failures only: resending POSTs would stall the waiting client request
+                max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+            ))
+            self._session = session
+        return self._session
 
     def get_active_account(self):
         """Retrieve the active account from the database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db_lock:
+                conn = self._get_connection()
 
-            # First fetch the active account
-            cursor.execute('SELECT value FROM proxy_settings WHERE key = ?', ('active_account',))
-            active_result = cursor.fetchone()
+                # First fetch the active account
+                active_result = conn.execute('SELECT value FROM proxy_settings WHERE key = ?',
+                                             ('active_account',)).fetchone()
+                if not active_result:
+                    return None, None
 
-            if active_result:
                 active_email = active_result[0]
                 # Then get account data
-                cursor.execute('SELECT account_data FROM accounts WHERE email = ?', (active_email,))
-                account_result = cursor.fetchone()
-
-                if account_result:
-                    account_data = json.loads(account_result[0])
-                    conn.close()
-                    return active_email, account_data
+                account_result = conn.execute('SELECT account_data FROM accounts WHERE email = ?',
+                                              (active_email,)).fetchone()
 
-            conn.close()
+            if account_result:
+                return active_email, json.loads(account_result[0])
             return None, None
         except Exception as e:
             print(f"Active account lookup error: {e}")
@@ -179,8 +210,6 @@ class WarpProxyHandler:
     def refresh_token(self, email, account_data):
         """Refresh Firebase token"""
         try:
-            import requests
-
             refresh_token = account_data['stsTokenManager']['refreshToken']
             api_key = account_data['apiKey']
 
@@ -192,7 +221,7 @@ class WarpProxyHandler:
 
             # Connect without proxy
             proxies = {'http': None, 'https': None}
-            response = requests.post(url, json=data, timeout=30, verify=False, proxies=proxies)
+            response = self._get_session().post(url, json=data, timeout=30, verify=False, proxies=proxies)
 
             if response.status_code == 200:
                 token_data = response.json()
@@ -203,22 +232,24 @@ class WarpProxyHandler:
                 }
 
                 # Update database
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('SELECT account_data FROM accounts WHERE email = ?', (email,))
-                result = cursor.fetchone()
-
-                if result:
-                    account_data = json.loads(result[0])
-                    account_data['stsTokenManager'].update(new_token_data)
-
-                    cursor.execute('''
-                        UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP
-                        WHERE email = ?
-                    ''', (json.dumps(account_data), email))
-                    conn.commit()
-
-                conn.close()
+                with self._db_lock:
+                    conn = self._get_connection()
+                    conn.execute('BEGIN IMMEDIATE')
+                    try:
+                        result = conn.execute('SELECT account_data FROM accounts WHERE email = ?',
+                                              (email,)).fetchone()
+                        if result:
+                            account_data = json.loads(result[0])
+                            account_data['stsTokenManager'].update(new_token_data)
+
+                            conn.execute('''
+                                UPDATE accounts SET account_data = ?, token_expiry = ?, last_updated = CURRENT_TIMESTAMP
+                                WHERE email = ?
+                            ''', (json.dumps(account_data, separators=(',', ':')), new_token_data['expirationTime'], email))
+                        conn.execute('COMMIT')
+                    except Exception:
+                        conn.execute('ROLLBACK')
+                        raise
                 return True
             return False
         except Exception as e:
@@ -228,26 +259,25 @@ class WarpProxyHandler:
     def mark_account_as_banned(self, email):
         """Mark an account as banned"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._db_lock:
+                conn = self._get_connection()
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    # Update account health to banned
+                    conn.execute('''
+                        UPDATE accounts SET health_status = 'banned', health_code = ?, last_updated = CURRENT_TIMESTAMP
+                        WHERE email = ?
+                    ''', (HEALTH_BANNED, email))
 
-            # Update account health_status to 'banned'
-            cursor.execute('''
-                UPDATE accounts SET health_status = 'banned', last_updated = CURRENT_TIMESTAMP
-                WHERE email = ?
-            ''', (email,))
-            conn.commit()
-            conn.close()
+                    # Clear active account (a banned account cannot remain active)
+                    conn.execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
 
             print(f"Account marked as banned: {email}")
 
-            # Clear active account (a banned account cannot remain active)
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
-            conn.commit()
-            conn.close()
-
             # Clear active account data in handler
             self.active_token = None
             self.active_email = None
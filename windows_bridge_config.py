@@ -29,7 +29,7 @@ class BridgeConfig:
             import ctypes
             try:
                 return ctypes.windll.shell32.IsUserAnAdmin()
-            except:
+            except (AttributeError, OSError):
                 return False
 
     def setup_localhost_access(self):